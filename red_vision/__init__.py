@@ -13,3 +13,4 @@ from . import displays
 from . import touch_screens
 from .utils import colors
 from .utils import memory
+from .utils import keys
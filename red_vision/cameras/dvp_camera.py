@@ -32,7 +32,8 @@ class DVP_Camera(VideoCaptureDriver):
             height (int, optional): Image height in pixels
             width (int, optional): Image width in pixels
             color_mode (int, optional): Color mode to use
-            buffer (ndarray, optional): Pre-allocated image buffer
+            buffer (ndarray or list, optional): Pre-allocated image buffer, or
+                a list of buffers to capture into in turn (continuous mode only)
         """
         # Store I2C parameters.
         self._i2c = i2c
@@ -60,7 +60,7 @@ class DVP_RP2_PIO():
 
     def begin(
             self,
-            buffer,
+            buffers,
             xclk_freq,
             num_data_pins,
             byte_swap,
@@ -70,7 +70,9 @@ class DVP_RP2_PIO():
         Begins the DVP interface with the specified parameters.
 
         Args:
-            buffer (ndarray): Image buffer to write captured frames into
+            buffers (list): Image buffers to write captured frames into. If
+                more than one buffer is given, frames are captured into each
+                buffer in turn, which requires continuous mode
             xclk_freq (int): Frequency in Hz for the XCLK pin, if it is used
             num_data_pins (int): Number of data pins used by the camera (1 to 8)
             byte_swap (bool): Whether to swap bytes in each pixel
@@ -81,9 +83,16 @@ class DVP_RP2_PIO():
         # a garbage collection now to free up as much memory as possible.
         gc.collect()
 
-        # Store buffer and its dimensions
-        self._buffer = buffer
-        self._height, self._width, self._bytes_per_pixel = buffer.shape
+        # Store buffers and their dimensions
+        self._buffers = buffers
+        self._buffer = buffers[0]
+        self._height, self._width, self._bytes_per_pixel = self._buffer.shape
+        self._bytes_per_frame = self._height * self._width * self._bytes_per_pixel
+
+        # Capturing into multiple buffers relies on the DMA control block
+        # sequence continuously restarting itself.
+        if len(buffers) > 1 and not continuous:
+            raise ValueError("Multiple buffers require continuous mode")
 
         # Initialize DVP pins as inputs
         self._num_data_pins = num_data_pins
@@ -199,6 +208,76 @@ class DVP_RP2_PIO():
         self._stop_capture()
         return True
 
+    def acquire_next(self):
+        """
+        Acquires the buffer containing the next captured frame. With a single
+        buffer, this simply grabs a frame. With multiple buffers, this waits
+        until the DMA has finished filling a buffer that has not been acquired
+        yet, and returns the most recently completed one. The DMA continues
+        capturing into the other buffers in the meantime.
+
+        Returns:
+            int: Index of the acquired buffer, or -1 if not opened
+        """
+        # Check if opened.
+        if not self._opened:
+            return -1
+
+        # With only 1 buffer, just grab a frame into it.
+        if len(self._buffers) == 1:
+            return 0 if self.grab() else -1
+
+        # Wait for a new frame to be completed.
+        index = self._last_index
+        while index == self._last_index:
+            index = self._latest_buffer_index()
+
+        # Remember this buffer so it's not returned again for the same frame.
+        self._last_index = index
+        return index
+
+    def release_buffer(self, index):
+        """
+        Releases a buffer previously acquired with `acquire_next()`.
+
+        The DMA does not pause for acquired buffers, so a frame must be
+        processed (or copied) before the DMA wraps around to the same buffer,
+        which takes `len(buffers) - 1` frame periods. For example, with 3
+        buffers, there are 2 frame periods to process each frame.
+
+        Args:
+            index (int): Index of the buffer to release
+        """
+        # Nothing to do, the DMA keeps cycling through all buffers.
+        pass
+
+    def _latest_buffer_index(self):
+        """
+        Determines which buffer contains the most recently completed frame,
+        based on the current write address of the executer DMA channel.
+
+        Returns:
+            int: Index of the most recently completed buffer
+        """
+        write_addr = self._dma_executer.write
+        num_buffers = len(self._buffers)
+        for i in range(num_buffers):
+            start_addr = addressof(self._buffers[i])
+            end_addr = start_addr + self._bytes_per_frame
+
+            # If the DMA just finished this buffer, it's the latest one.
+            if write_addr == end_addr:
+                return i
+
+            # If the DMA is still writing this buffer, the previous one is the
+            # latest one.
+            if start_addr <= write_addr < end_addr:
+                return (i - 1) % num_buffers
+
+        # The write address isn't in any buffer, which means the executer is
+        # restarting the control block sequence after the last buffer.
+        return num_buffers - 1
+
     def _setup_pio(self):
         """
         Sets up the PIO state machine for the DVP interface.
@@ -261,7 +340,10 @@ class DVP_RP2_PIO():
         # frame of data from the PIO RX FIFO to the image buffer with a single
         # control block. The second control block then makes the executer write
         # a third "nested" control block to the dispatcher, reconfiguring it to
-        # start the next frame, resulting in continuous video capture.
+        # start the next frame, resulting in continuous video capture. If
+        # multiple image buffers are provided, there is one frame control block
+        # per buffer, so consecutive frames are captured into each buffer in
+        # turn, and the CPU can process one buffer while the others are filled.
         # 
         # +--------------------------+
         # |+------------+    +------+|      +-------+
@@ -336,6 +418,13 @@ class DVP_RP2_PIO():
         # Check if the display buffer is in PSRAM.
         self._buffer_is_in_psram = rv_memory.is_in_external_ram(self._buffer)
 
+        # Multiple buffers are only supported in SRAM, since the PSRAM control
+        # block sequence does not restart itself.
+        if len(self._buffers) > 1:
+            for buffer in self._buffers:
+                if rv_memory.is_in_external_ram(buffer):
+                    raise MemoryError("Multiple buffers must all be in SRAM")
+
         # If the buffer is in PSRAM, create the streamer DMA channel and row
         # buffer in SRAM.
         if self._buffer_is_in_psram:
@@ -462,7 +551,7 @@ class DVP_RP2_PIO():
         # reference it.
         num_cb = 0
         if not self._buffer_is_in_psram:
-            num_cb += 1 # PIO read control block
+            num_cb += len(self._buffers) # PIO read control blocks
             if self._continuous:
                 num_cb += 1 # Restart frame control block
         else:
@@ -497,14 +586,17 @@ class DVP_RP2_PIO():
         # Control blocks are different depending on whether the buffer is in
         # SRAM or PSRAM.
         if not self._buffer_is_in_psram:
-            # Control block for executer to read entire frame from PIO RX FIFO
-            # to image buffer.
-            self._cb_pio_repeat = array.array('I', [
-                pio_rx_fifo_addr, # READ_ADDR
-                addressof(self._buffer), # WRITE_ADDR
-                self._width * self._height, # TRANS_COUNT
-                self._dma_ctrl_pio_repeat, # CTRL_TRIG
-            ])
+            # Control blocks for executer to read entire frame from PIO RX FIFO
+            # to each image buffer. With multiple buffers, the frames are
+            # captured into each buffer in turn.
+            self._cb_pio_frames = []
+            for buffer in self._buffers:
+                self._cb_pio_frames.append(array.array('I', [
+                    pio_rx_fifo_addr, # READ_ADDR
+                    addressof(buffer), # WRITE_ADDR
+                    self._bytes_per_frame // self._bytes_per_transfer, # TRANS_COUNT
+                    self._dma_ctrl_pio_repeat, # CTRL_TRIG
+                ]))
 
             # Control blocks for restarting the dispatcher. `_cb_restart_frame`
             # must be the last control block in the sequence, which causes the
@@ -571,9 +663,10 @@ class DVP_RP2_PIO():
         # Control blocks are different depending on whether the buffer is in
         # SRAM or PSRAM.
         if not self._buffer_is_in_psram:
-            # Add control block for executer to read entire frame from PIO RX
-            # FIFO to image buffer.
-            self._add_control_block(self._cb_pio_repeat)
+            # Add control blocks for executer to read entire frame from PIO RX
+            # FIFO to each image buffer.
+            for cb_pio_frame in self._cb_pio_frames:
+                self._add_control_block(cb_pio_frame)
 
             # If continuous mode is requested, add control block to restart the
             # control block sequence reconfiguring the dispatcher DMA.
@@ -627,6 +720,10 @@ class DVP_RP2_PIO():
                 trigger = False,
             )
         
+        # No buffers have been acquired yet. The last buffer is considered to
+        # be the most recent one until the DMA finishes filling the first one.
+        self._last_index = len(self._buffers) - 1
+
         # Configure the dispatcher DMA channel to start the control block
         # sequence, but don't trigger it yet.
         self._dma_dispatcher.config(
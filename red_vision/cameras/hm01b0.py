@@ -265,7 +265,8 @@ class HM01B0(DVP_Camera):
             width (int, optional): Image width in pixels
             color_mode (int, optional): Color mode to use:
                 - COLOR_MODE_BAYER_RG (default)
-            buffer (ndarray, optional): Pre-allocated image buffer
+            buffer (ndarray or list, optional): Pre-allocated image buffer, or
+                a list of buffers to capture into in turn (continuous mode only)
         """
         # Store parameters
         self._interface = interface
@@ -277,7 +278,7 @@ class HM01B0(DVP_Camera):
 
         # Begin the interface driver
         self._interface.begin(
-            self._buffer,
+            self._buffers,
             xclk_freq = xclk_freq,
             num_data_pins = self._num_data_pins,
             byte_swap = False,
@@ -359,6 +360,24 @@ class HM01B0(DVP_Camera):
         """
         return self._interface.grab()
 
+    def acquire_next(self):
+        """
+        Acquires the image buffer containing the next captured frame.
+
+        Returns:
+            int: Index of the acquired buffer, or -1 if no frame was captured
+        """
+        return self._interface.acquire_next()
+
+    def release_buffer(self, index):
+        """
+        Releases an image buffer previously acquired with `acquire_next()`.
+
+        Args:
+            index (int): Index of the buffer to release
+        """
+        self._interface.release_buffer(index)
+
     def _is_connected(self):
         """
         Checks if the camera is connected by reading the chip ID.
@@ -913,7 +913,9 @@ class OV5640(DVP_Camera):
             width (int, optional): Image width in pixels
             color_mode (int, optional): Color mode to use:
                 - COLOR_MODE_BGR565 (default)
-            buffer (ndarray, optional): Pre-allocated image buffer
+                - COLOR_MODE_GRAY8
+            buffer (ndarray or list, optional): Pre-allocated image buffer, or
+                a list of buffers to capture into in turn (continuous mode only)
         """
         # Store parameters
         self._interface = interface
@@ -924,7 +926,7 @@ class OV5640(DVP_Camera):
 
         # Begin the interface driver
         self._interface.begin(
-            self._buffer,
+            self._buffers,
             xclk_freq = xclk_freq,
             num_data_pins = 8,
             byte_swap = False,
@@ -935,7 +937,10 @@ class OV5640(DVP_Camera):
         self._write_list(self._sensor_default_regs)
 
         # Set default settings
-        self._colorspace = self._OV5640_COLOR_RGB
+        if self._color_mode == rv_colors.COLOR_MODE_GRAY8:
+            self._colorspace = self._OV5640_COLOR_GRAYSCALE
+        else:
+            self._colorspace = self._OV5640_COLOR_RGB
         self._flip_x = True
         self._flip_y = True
         self._w = None
@@ -989,7 +994,8 @@ class OV5640(DVP_Camera):
         Returns:
             bool: True if the color mode is supported, otherwise False
         """
-        return color_mode == rv_colors.COLOR_MODE_BGR565
+        return (color_mode == rv_colors.COLOR_MODE_BGR565 or
+                color_mode == rv_colors.COLOR_MODE_GRAY8)
 
     def open(self):
         """
@@ -1021,6 +1027,24 @@ class OV5640(DVP_Camera):
         """
         return self._interface.grab()
 
+    def acquire_next(self):
+        """
+        Acquires the image buffer containing the next captured frame.
+
+        Returns:
+            int: Index of the acquired buffer, or -1 if no frame was captured
+        """
+        return self._interface.acquire_next()
+
+    def release_buffer(self, index):
+        """
+        Releases an image buffer previously acquired with `acquire_next()`.
+
+        Args:
+            index (int): Index of the buffer to release
+        """
+        self._interface.release_buffer(index)
+
     def _is_connected(self):
         """
         Checks if the camera is connected by reading the chip ID.
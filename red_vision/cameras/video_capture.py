@@ -30,6 +30,33 @@ class VideoCapture():
         # Store driver reference.
         self._driver = driver
 
+        # Index of the buffer acquired by `grab()`, which `retrieve()` uses by
+        # default. It's held until the next call to `grab()`.
+        self._grabbed_index = None
+
+        # The driver's color mode does not change, so determine the OpenCV
+        # color conversion code once here instead of on every frame. None means
+        # the buffer is copied directly with no conversion.
+        color_mode = self._driver.color_mode()
+        if (color_mode == rv_colors.COLOR_MODE_BGR888 or
+                color_mode == rv_colors.COLOR_MODE_GRAY8 or
+                color_mode == rv_colors.COLOR_MODE_BGR233): # No conversion available
+            self._conversion_code = None
+        elif color_mode == rv_colors.COLOR_MODE_BAYER_BG:
+            self._conversion_code = cv2.COLOR_BayerBG2BGR
+        elif color_mode == rv_colors.COLOR_MODE_BAYER_GB:
+            self._conversion_code = cv2.COLOR_BayerGB2BGR
+        elif color_mode == rv_colors.COLOR_MODE_BAYER_RG:
+            self._conversion_code = cv2.COLOR_BayerRG2BGR
+        elif color_mode == rv_colors.COLOR_MODE_BAYER_GR:
+            self._conversion_code = cv2.COLOR_BayerGR2BGR
+        elif color_mode == rv_colors.COLOR_MODE_BGR565:
+            self._conversion_code = cv2.COLOR_BGR5652BGR
+        elif color_mode == rv_colors.COLOR_MODE_BGRA8888:
+            self._conversion_code = cv2.COLOR_BGRA2BGR
+        else:
+            raise NotImplementedError("Unsupported color mode")
+
     def open(self):
         """
         Opens the camera and prepares it for capturing images.
@@ -40,6 +67,7 @@ class VideoCapture():
         """
         Releases the camera and frees any resources.
         """
+        self._release_grabbed()
         self._driver.release()
 
     def isOpened(self):
@@ -58,24 +86,64 @@ class VideoCapture():
         Returns:
             bool: True if the frame was grabbed successfully, otherwise False
         """
-        return self._driver.grab()
+        # Release the previously grabbed buffer so the driver can capture into
+        # it again, then acquire the buffer containing the next frame.
+        self._release_grabbed()
+        index = self.acquire_next()
+        if index < 0:
+            return False
+        self._grabbed_index = index
+        return True
+
+    def _release_grabbed(self):
+        """
+        Releases the buffer acquired by `grab()`, if any.
+        """
+        if self._grabbed_index is not None:
+            self.release_buffer(self._grabbed_index)
+            self._grabbed_index = None
 
-    def retrieve(self, image = None):
+    def acquire_next(self):
+        """
+        Acquires the image buffer containing the next captured frame. The
+        buffer can be retrieved with `retrieve()` by passing the returned index,
+        and should be released with `release_buffer()` once it's done.
+
+        Returns:
+            int: Index of the acquired buffer, or -1 if no frame was captured
+        """
+        return self._driver.acquire_next()
+
+    def release_buffer(self, index):
+        """
+        Releases an image buffer previously acquired with `acquire_next()`.
+
+        Args:
+            index (int): Index of the buffer to release
+        """
+        self._driver.release_buffer(index)
+
+    def retrieve(self, image = None, index = None):
         """
         Retrieves the most recently grabbed frame from the camera.
 
         Args:
             image (ndarray, optional): Image to retrieve into
+            index (int, optional): Index of an acquired buffer to retrieve from,
+                otherwise the buffer acquired by the last `grab()` is used
         Returns:
             tuple: (success, image)
                 - success (bool): True if the image was retrieved, otherwise False
                 - image (ndarray): The retrieved image, or None if retrieval failed
         """
-        color_mode = self._driver.color_mode()
-        buffer = self._driver.buffer()
-        if (color_mode == rv_colors.COLOR_MODE_BGR888 or
-                color_mode == rv_colors.COLOR_MODE_GRAY8 or
-                color_mode == rv_colors.COLOR_MODE_BGR233): # No conversion available
+        if index is None:
+            index = self._grabbed_index
+        if index is None:
+            # Nothing has been grabbed, so use the driver's default buffer.
+            buffer = self._driver.buffer()
+        else:
+            buffer = self._driver.buffers()[index]
+        if self._conversion_code is None:
             # These color modes are copied directly with no conversion.
             if image is not None:
                 # Copy buffer to provided image.
@@ -84,20 +152,10 @@ class VideoCapture():
             else:
                 # Return a copy of the buffer.
                 return (True, buffer.copy())
-        elif color_mode == rv_colors.COLOR_MODE_BAYER_BG:
-            return (True, cv2.cvtColor(buffer, cv2.COLOR_BayerBG2BGR, image))
-        elif color_mode == rv_colors.COLOR_MODE_BAYER_GB:
-            return (True, cv2.cvtColor(buffer, cv2.COLOR_BayerGB2BGR, image))
-        elif color_mode == rv_colors.COLOR_MODE_BAYER_RG:
-            return (True, cv2.cvtColor(buffer, cv2.COLOR_BayerRG2BGR, image))
-        elif color_mode == rv_colors.COLOR_MODE_BAYER_GR:
-            return (True, cv2.cvtColor(buffer, cv2.COLOR_BayerGR2BGR, image))
-        elif color_mode == rv_colors.COLOR_MODE_BGR565:
-            return (True, cv2.cvtColor(buffer, cv2.COLOR_BGR5652BGR, image))
-        elif color_mode == rv_colors.COLOR_MODE_BGRA8888:
-            return (True, cv2.cvtColor(buffer, cv2.COLOR_BGRA2BGR, image))
-        else:
-            NotImplementedError("Unsupported color mode")
+
+        # Convert the buffer to BGR888 in a single OpenCV call, which is
+        # implemented in C and much faster than any per-pixel Python code.
+        return (True, cv2.cvtColor(buffer, self._conversion_code, image))
 
     def read(self, image = None):
         """
@@ -111,6 +169,9 @@ class VideoCapture():
                 - success (bool): True if the image was read, otherwise False
                 - image (ndarray): The captured image, or None if reading failed
         """
-        if not self.grab():
+        index = self.acquire_next()
+        if index < 0:
             return (False, None)
-        return self.retrieve(image = image)
+        result = self.retrieve(image = image, index = index)
+        self.release_buffer(index)
+        return result
@@ -40,3 +40,23 @@ class VideoCaptureDriver(VideoDriver):
             bool: True if the frame was grabbed successfully, otherwise False
         """
         raise NotImplementedError("Subclass must implement this method")
+
+    def acquire_next(self):
+        """
+        Acquires the image buffer containing the next captured frame. Must be
+        followed by a call to `release_buffer()` once the frame is processed.
+
+        Returns:
+            int: Index of the acquired buffer in `buffers()`, or -1 if no frame
+                could be captured
+        """
+        raise NotImplementedError("Subclass must implement this method")
+
+    def release_buffer(self, index):
+        """
+        Releases an image buffer previously acquired with `acquire_next()`.
+
+        Args:
+            index (int): Index of the buffer to release
+        """
+        raise NotImplementedError("Subclass must implement this method")
@@ -109,6 +109,18 @@ class SPI_RP2_PIO():
             command (bytes, optional): Command to send to the display
             data (bytes, optional): Data to send to the display
         """
+        self.write_commands([(command, data)])
+
+    def write_commands(self, commands):
+        """
+        Writes a sequence of commands and their data to the display in a single
+        transaction, so the chip select and pin setup only happen once.
+
+        Args:
+            commands (list): List of tuples (command, data), where command may
+                be None to only write data, and data may be None for commands
+                without data
+        """
         # Save the current mode and alt of the spi pins in case they're used by
         # another device on the same SPI bus
         dcMode, dcAlt = save_pin_mode_alt(self._dc)
@@ -123,12 +135,13 @@ class SPI_RP2_PIO():
         # Write to the display
         if self._cs:
             self._cs.off()
-        if command is not None:
-            self._dc.off()
-            self._pio_write(command)
-        if data is not None:
-            self._dc.on()
-            self._pio_write(data)
+        for command, data in commands:
+            if command is not None:
+                self._dc.off()
+                self._pio_write(command)
+            if data is not None:
+                self._dc.on()
+                self._pio_write(data)
         if self._cs:
             self._cs.on()
 
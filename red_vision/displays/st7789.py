@@ -152,6 +152,13 @@ class ST7789(VideoDisplayDriver):
         self._interface = interface
         super().__init__(height, width, color_mode, buffer)
 
+        # When sending BGR565 pixel data, the ST7789 expects each pair of bytes
+        # to be sent in the opposite endianness of what the SPI peripheral would
+        # normally send. So we just swap each pair of bytes. The swapped view
+        # shares memory with the framebuffer, so it's created once here instead
+        # of every time the display is updated.
+        self._buffer_swapped = self._buffer[:,:,::-1]
+
         # Initial rotation
         self._rotation = rotation % 4
 
@@ -224,10 +231,35 @@ class ST7789(VideoDisplayDriver):
         """
         Updates the display with the contents of the framebuffer.
         """
-        # When sending BGR565 pixel data, the ST7789 expects each pair of bytes
-        # to be sent in the opposite endianness of what the SPI peripheral would
-        # normally send. So we just swap each pair of bytes.
-        self._interface.write(None, self._buffer[:,:,::-1])
+        # Send the whole framebuffer in a single write, using the byte swapped
+        # view created in `__init__()`.
+        self._interface.write(None, self._buffer_swapped)
+
+    def show_rect(self, x, y, w, h):
+        """
+        Updates a rectangular region of the display with the contents of the
+        framebuffer. Only the pixels in the region are sent to the display.
+
+        Args:
+            x (int): X coordinate of the region's top left corner
+            y (int): Y coordinate of the region's top left corner
+            w (int): Width of the region in pixels
+            h (int): Height of the region in pixels
+        """
+        # Set the window to the region.
+        self._set_window(x, y, w, h)
+
+        # Send the region's pixel data. Each row must be sent separately unless
+        # the region is the full width of the framebuffer. The bytes are swapped
+        # the same way as in `show()`.
+        if w == self._width:
+            self._interface.write(None, self._buffer_swapped[y:y+h])
+        else:
+            for row in range(y, y + h):
+                self._interface.write(None, self._buffer_swapped[row,x:x+w])
+
+        # Restore the window to the full display, so `show()` works as normal.
+        self._set_window(0, 0, self._width, self._height)
 
     def _send_init(self, commands):
         """
@@ -290,10 +322,25 @@ class ST7789(VideoDisplayDriver):
         madctl |= self._ST7789_MADCTL_BGR
         self._interface.write(self._ST7789_MADCTL, bytes([madctl]))
         # Set window for writing into
-        self._interface.write(self._ST7789_CASET,
-            struct.pack(self._ENCODE_POS, self._xstart, self._width + self._xstart - 1))
-        self._interface.write(self._ST7789_RASET,
-            struct.pack(self._ENCODE_POS, self._ystart, self._height + self._ystart - 1))
-        self._interface.write(self._ST7789_RAMWR)
+        self._set_window(0, 0, self._width, self._height)
         # TODO: Can we swap (modify) framebuffer width/height in the super() class?
         self._rotation = rotation
+
+    def _set_window(self, x, y, w, h):
+        """
+        Sets the window for writing pixel data into, and starts writing at its
+        top left corner.
+
+        Args:
+            x (int): X coordinate of the window's top left corner
+            y (int): Y coordinate of the window's top left corner
+            w (int): Width of the window in pixels
+            h (int): Height of the window in pixels
+        """
+        x += self._xstart
+        y += self._ystart
+        self._interface.write_commands([
+            (self._ST7789_CASET, struct.pack(self._ENCODE_POS, x, x + w - 1)),
+            (self._ST7789_RASET, struct.pack(self._ENCODE_POS, y, y + h - 1)),
+            (self._ST7789_RAMWR, None),
+        ])
@@ -13,6 +13,13 @@ import cv2 as cv
 from ulab import numpy as np
 from ..utils import colors as rv_colors
 
+# DMA is used to copy images that are already in the display's format, if
+# available.
+import sys
+if 'rp2' in sys.platform:
+    import rp2
+    from uctypes import addressof
+
 class VideoDisplay():
     """
     Red Vision generic display class. This is to be used with `cv.imshow()` in
@@ -21,16 +28,44 @@ class VideoDisplay():
     def __init__(
             self,
             driver,
+            skip_unchanged = False,
             ):
         """
         Initializes a VideoDisplay object with the provided driver.
 
         Args:
             driver (VideoDisplayDriver): Display driver to use
+            skip_unchanged (bool, optional): If True, `imshow()` skips sending
+                the buffer to the display when its contents have not changed
+                since the last update. This costs a checksum of the buffer on
+                every call, so it's only worthwhile when the same image is
+                often shown repeatedly on a slow display. Default is False
         """
         # Store driver reference.
         self._driver = driver
 
+        # Checksum of the buffer contents last sent to the display, if unchanged
+        # images are being skipped. `crc32()` is only imported when needed, so
+        # builds without it can still use the display normally.
+        self._skip_unchanged = skip_unchanged
+        self._last_crc = None
+        if skip_unchanged:
+            from binascii import crc32
+            self._crc32 = crc32
+
+        # DMA channel used to copy images to the buffer. It's only claimed the
+        # first time it's needed, and freed by `release()`.
+        self._dma = None
+
+    def release(self):
+        """
+        Releases the display and frees any resources.
+        """
+        # Free the DMA channel, if one was claimed.
+        if self._dma is not None:
+            self._dma.close()
+            self._dma = None
+
     def imshow(self, image):
         """
         Shows a NumPy image on the display.
@@ -41,6 +76,63 @@ class VideoDisplay():
         # Get the common ROI between the image and internal display buffer.
         image_roi, buffer_roi = self._get_common_roi_with_buffer(image)
 
+        # Write the image to the buffer.
+        self._write_to_buffer(image_roi, buffer_roi)
+
+        # Skip updating the display if the buffer hasn't changed since the last
+        # update.
+        if self._skip_unchanged:
+            crc = self._crc32(self._driver.buffer())
+            if crc == self._last_crc:
+                return
+            self._last_crc = crc
+
+        # Show the buffer on the display.
+        self._driver.show()
+
+    def imshow_rect(self, image, rect):
+        """
+        Shows a rectangular region of a NumPy image on the display. Only the
+        region is written to the display buffer and sent to the display (if
+        supported by the driver), which is faster than `imshow()` when only a
+        small part of the image has changed.
+
+        Args:
+            image (ndarray): Image to show
+            rect (tuple): (x, y, w, h) region of the image to show
+        """
+        # Get the common ROI between the image and internal display buffer.
+        image_roi, buffer_roi = self._get_common_roi_with_buffer(image)
+
+        # Clip the region to the common ROI.
+        x, y, w, h = rect
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, buffer_roi.shape[1])
+        y1 = min(y + h, buffer_roi.shape[0])
+        if x1 <= x0 or y1 <= y0:
+            # Region is empty, nothing to show.
+            return
+
+        # Write the region of the image to the buffer.
+        self._write_to_buffer(image_roi[y0:y1, x0:x1], buffer_roi[y0:y1, x0:x1])
+
+        # Show the region of the buffer on the display.
+        self._driver.show_rect(x0, y0, x1 - x0, y1 - y0)
+
+        # The buffer has changed, so the next `imshow()` must update the
+        # display.
+        self._last_crc = None
+
+    def _write_to_buffer(self, image_roi, buffer_roi):
+        """
+        Converts an image to the display's color mode and writes it to the
+        display buffer.
+
+        Args:
+            image_roi (ndarray): Image to write
+            buffer_roi (ndarray): Region of the display buffer to write to
+        """
         # Ensure the image is in uint8 format
         image_roi = self._convert_to_uint8(image_roi)
 
@@ -63,15 +155,13 @@ class VideoDisplay():
         else:
             raise ValueError("Unsupported color mode")
 
-        # Show the buffer on the display.
-        self._driver.show()
-
     def clear(self):
         """
         Clears the display by filling it with black color.
         """
         self._driver.buffer()[:] = 0
         self._driver.show()
+        self._last_crc = None
 
     def splash(self, filename="splash.png"):
         """
@@ -150,6 +240,89 @@ class VideoDisplay():
         else:
             raise ValueError(f"Unsupported image dtype: {image.dtype}")
 
+    def _copy_to_buffer(self, src, dst):
+        """
+        Copies an image to the display buffer without any conversion. Both must
+        have the same number of channels.
+
+        Args:
+            src (ndarray): Input image
+            dst (ndarray): Output buffer
+        """
+        # On RP2 processors, contiguous images can be copied with a DMA channel,
+        # which is much faster than copying with NumPy.
+        if 'rp2' in sys.platform and self._is_contiguous(src) and self._is_contiguous(dst):
+            self._dma_copy(src, dst)
+            return
+
+        # Fall back to copying with NumPy.
+        # For some reason, this is relatively slow and creates a new buffer:
+        # https://github.com/v923z/micropython-ulab/issues/726
+        dst[:] = src.reshape(dst.shape)
+
+    def _is_contiguous(self, image):
+        """
+        Checks whether an image is stored contiguously in memory, meaning it's
+        not a strided view (eg. a cropped ROI) of a larger image.
+
+        Args:
+            image (ndarray): Image to check
+
+        Returns:
+            bool: True if the image is contiguous, otherwise False
+        """
+        # Each dimension must step over exactly the elements of the following
+        # dimensions.
+        expected_stride = image.itemsize
+        for i in range(image.ndim - 1, -1, -1):
+            if image.strides[i] != expected_stride:
+                return False
+            expected_stride *= image.shape[i]
+        return True
+
+    def _dma_copy(self, src, dst):
+        """
+        Copies a contiguous image to a contiguous buffer with a DMA channel.
+        Only available on Raspberry Pi RP2 processors.
+
+        Args:
+            src (ndarray): Input image
+            dst (ndarray): Output buffer
+        """
+        # Nothing to copy for an empty image.
+        num_bytes = src.size * src.itemsize
+        if num_bytes == 0:
+            return
+
+        # Instantiate a DMA controller if not already done.
+        if self._dma is None:
+            self._dma = rp2.DMA()
+
+        # Use 4 byte transfers if everything is word aligned, otherwise copy 1
+        # byte at a time.
+        read_addr = addressof(src)
+        write_addr = addressof(dst)
+        if (read_addr | write_addr | num_bytes) & 0x3 == 0:
+            size = 2
+            count = num_bytes // 4
+        else:
+            size = 0
+            count = num_bytes
+
+        # Start the transfer.
+        self._dma.config(
+            read = read_addr,
+            write = write_addr,
+            count = count,
+            ctrl = self._dma.pack_ctrl(size = size),
+            trigger = True,
+        )
+
+        # The buffer is sent to the display immediately after this, so wait for
+        # the transfer to finish.
+        while self._dma.active():
+            pass
+
     def _convert_to_gray8(self, src, dst):
         """
         Converts an image to GRAY8 format.
@@ -167,9 +340,7 @@ class VideoDisplay():
         # Convert the image to GRAY8 format based on the number of channels
         if ch == 1: # GRAY8
             # Already in GRAY8 format
-            # For some reason, this is relatively slow and creates a new buffer:
-            # https://github.com/v923z/micropython-ulab/issues/726
-            dst[:] = src.reshape(dst.shape)
+            self._copy_to_buffer(src, dst)
         elif ch == 2: # BGR565
             dst = cv.cvtColor(src, cv.COLOR_BGR5652GRAY, dst)
         elif ch == 3: # BGR888
@@ -198,9 +369,7 @@ class VideoDisplay():
             dst = cv.cvtColor(src, cv.COLOR_GRAY2BGR565, dst)
         elif ch == 2: # BGR565
             # Already in BGR565 format
-            # For some reason, this is relatively slow and creates a new buffer:
-            # https://github.com/v923z/micropython-ulab/issues/726
-            dst[:] = src.reshape(dst.shape)
+            self._copy_to_buffer(src, dst)
         elif ch == 3: # BGR888
             dst = cv.cvtColor(src, cv.COLOR_BGR2BGR565, dst)
         elif ch == 4: # BGRA8888
@@ -229,9 +398,7 @@ class VideoDisplay():
             dst = cv.cvtColor(src, cv.COLOR_BGR5652BGR, dst)
         elif ch == 3: # BGR888
             # Already in BGR888 format
-            # For some reason, this is relatively slow and creates a new buffer:
-            # https://github.com/v923z/micropython-ulab/issues/726
-            dst[:] = src.reshape(dst.shape)
+            self._copy_to_buffer(src, dst)
         elif ch == 4: # BGRA8888
             dst = cv.cvtColor(src, cv.COLOR_BGRA2BGR, dst)
         else:
@@ -260,8 +427,6 @@ class VideoDisplay():
             dst = cv.cvtColor(src, cv.COLOR_BGR2BGRA, dst)
         elif ch == 4: # BGRA8888
             # Already in BGRA8888 format
-            # For some reason, this is relatively slow and creates a new buffer:
-            # https://github.com/v923z/micropython-ulab/issues/726
-            dst[:] = src.reshape(dst.shape)
+            self._copy_to_buffer(src, dst)
         else:
             raise ValueError("Unsupported number of channels in source image")
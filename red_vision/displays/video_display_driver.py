@@ -25,3 +25,17 @@ class VideoDisplayDriver(VideoDriver):
         Updates the display with the contents of the image buffer.
         """
         raise NotImplementedError("Subclass must implement this method")
+
+    def show_rect(self, x, y, w, h):
+        """
+        Updates a rectangular region of the display with the contents of the
+        image buffer. By default, the entire display is updated; drivers that
+        support partial updates can override this.
+
+        Args:
+            x (int): X coordinate of the region's top left corner
+            y (int): Y coordinate of the region's top left corner
+            w (int): Width of the region in pixels
+            h (int): Height of the region in pixels
+        """
+        self.show()
@@ -13,6 +13,9 @@
 # Copyright (c) 2021 Felix Biego
 #-------------------------------------------------------------------------------
 
+from array import array
+from machine import Pin
+
 class CST816():
     """
     Red Vision CST816 touch screen driver.
@@ -54,7 +57,11 @@ class CST816():
     _REG_IO_CTL = 0xFD
     _REG_DIS_AUTO_SLEEP = 0xFE
 
-    def __init__(self, i2c, width=240, height=320, rotation=1, address=_I2C_ADDRESS):
+    # IRQ control bits
+    _IRQ_EN_TOUCH = 0x40
+    _IRQ_EN_CHANGE = 0x20
+
+    def __init__(self, i2c, width=240, height=320, rotation=1, address=_I2C_ADDRESS, pin_irq=None, queue_size=64):
         """
         Initializes the CST816 driver.
 
@@ -71,6 +78,12 @@ class CST816():
               - 3: Inverted landscape
             address (int, optional): I2C address of the camera.
                 Default is 0x15
+            pin_irq (Pin, optional): Interrupt pin of the touch screen. If
+                provided, touch points are read when the interrupt triggers and
+                queued for `read_touch_points()`, so none are missed between
+                calls. Default is None (polling)
+            queue_size (int, optional): Maximum number of queued touch points
+                when `pin_irq` is used. Default is 64
         """
         self.i2c = i2c
         self.address = address
@@ -78,6 +91,26 @@ class CST816():
         self.height = height
         self.rotation = rotation
 
+        # Set up the touch point queue if an interrupt pin is provided.
+        self._pin_irq = None
+        if pin_irq is not None:
+            # Ring buffer of touch points, stored as pairs of x and y values. It
+            # is preallocated so the interrupt handler only has to write to it.
+            self._queue = array('h', [0] * (queue_size * 2))
+            self._queue_size = queue_size
+            self._queue_head = 0
+            self._queue_tail = 0
+
+            # By default, the touch screen only raises the interrupt for some
+            # touch events. Enable it for touches and for changes in the touch
+            # state, so releases are also queued.
+            self._write_register_value(self._REG_IRQ_CTL, self._IRQ_EN_TOUCH | self._IRQ_EN_CHANGE)
+
+            # The touch screen pulls the interrupt pin low when a touch event
+            # occurs.
+            self._pin_irq = Pin(pin_irq, Pin.IN, Pin.PULL_UP)
+            self._pin_irq.irq(self._irq_handler, Pin.IRQ_FALLING)
+
     def _is_connected(self):
         """
         Checks if the touch screen is connected by reading the chip ID.
@@ -144,6 +177,67 @@ class CST816():
 
         return (x, y)
 
+    def read_touch_points(self):
+        """
+        Reads all touch points since the last call. If an interrupt pin was not
+        provided, the touch screen is polled for a single touch point instead.
+
+        Returns:
+            list: Touch points in the order they occurred. Each point is an
+                (x, y) tuple, or None if the touch was released at that point
+        """
+        # Without an interrupt pin, just poll the current touch state.
+        if self._pin_irq is None:
+            if self.is_touched():
+                return [self.get_touch_xy()]
+            return [None]
+
+        # Read all queued touch points. Only the tail index is changed here,
+        # and only the head index is changed by the interrupt handler, so the
+        # queue can be read without disabling interrupts.
+        points = []
+        head = self._queue_head
+        tail = self._queue_tail
+        while tail != head:
+            x = self._queue[tail * 2]
+            y = self._queue[tail * 2 + 1]
+            if x < 0:
+                # Negative coordinates mark a touch release.
+                points.append(None)
+            else:
+                points.append((x, y))
+            tail = (tail + 1) % self._queue_size
+        self._queue_tail = tail
+        return points
+
+    def _irq_handler(self, pin):
+        """
+        Interrupt handler to read the current touch point and add it to the
+        touch point queue.
+
+        Args:
+            pin (Pin): Pin that triggered the interrupt
+        """
+        # Determine the next head index. If the queue is full, drop this touch
+        # point.
+        head = self._queue_head
+        next_head = (head + 1) % self._queue_size
+        if next_head == self._queue_tail:
+            return
+
+        # Add the touch point to the queue, or a negative point if the touch
+        # was released.
+        if self.is_touched():
+            x, y = self.get_touch_xy()
+        else:
+            x, y = -1, -1
+        self._queue[head * 2] = x
+        self._queue[head * 2 + 1] = y
+
+        # Update the head index last, so the point is complete before it can be
+        # read.
+        self._queue_head = next_head
+
     def _read_register_value(self, reg, num_bytes=1):
         """
         Read a single byte from the specified register.
@@ -161,3 +255,13 @@ class CST816():
         for i in range(num_bytes):
             value = (value << 8) | data[i]
         return value
+
+    def _write_register_value(self, reg, value):
+        """
+        Write a single byte to the specified register.
+
+        Args:
+            reg (int): Register address to write to
+            value (int): Value to write to the register
+        """
+        self.i2c.writeto_mem(self.address, reg, bytes([value]))
@@ -0,0 +1,39 @@
+#-------------------------------------------------------------------------------
+# SPDX-License-Identifier: MIT
+#
+# Copyright (c) 2025 SparkFun Electronics
+#-------------------------------------------------------------------------------
+# red_vision/utils/keys.py
+#
+# Red Vision key press utility functions.
+#-------------------------------------------------------------------------------
+
+import sys
+import select
+
+# Poll object for checking whether stdin has data available. It's created on
+# the first call to `poll_key()`.
+_stdin_poll = None
+
+def poll_key():
+    """
+    Checks for a key press without waiting. Unlike `cv.waitKey(1)`, this returns
+    immediately if no key has been pressed, so it does not limit how fast a
+    loop can run.
+
+    Returns:
+        int: Code of the pressed key, or -1 if no key was pressed
+    """
+    global _stdin_poll
+
+    # Register stdin with a poll object if not already done.
+    if _stdin_poll is None:
+        _stdin_poll = select.poll()
+        _stdin_poll.register(sys.stdin, select.POLLIN)
+
+    # Check if stdin has data available, with no timeout.
+    if not _stdin_poll.poll(0):
+        return -1
+
+    # Read the key press.
+    return ord(sys.stdin.read(1))
@@ -8,9 +8,11 @@
 # Red Vision memory utility functions.
 #-------------------------------------------------------------------------------
 
+import gc
 import sys
 import machine
 import uctypes
+from ulab import numpy as np
 
 def is_in_internal_ram(address):
     """
@@ -36,6 +38,44 @@ def is_in_external_ram(address):
     """
     return not is_in_internal_ram(address)
 
+def alloc_internal_ram(shape, dtype = np.uint8):
+    """
+    Allocates a zeroed NumPy array that is guaranteed to be in internal RAM.
+    This is useful for buffers accessed by DMA (eg. camera and display
+    buffers), which can be bottlenecked by the QSPI bus if they end up in
+    external RAM.
+
+    Args:
+        shape (tuple): Shape of the array
+        dtype (dtype, optional): Data type of the array (default: np.uint8)
+
+    Returns:
+        ndarray: Allocated array
+
+    Raises:
+        MemoryError: If there is not enough free internal RAM
+    """
+    # Internal RAM is allocated first when it's available, so run a garbage
+    # collection to free up as much of it as possible.
+    gc.collect()
+
+    # Allocate the array as a single flat block, then reshape it. This ensures
+    # the array is one contiguous C-order block of memory that DMA channels can
+    # transfer in a single pass.
+    size = 1
+    for dim in shape:
+        size *= dim
+    array = np.zeros(size, dtype = dtype).reshape(shape)
+
+    # Only RP2 processors have external RAM to avoid.
+    if "rp2" not in sys.platform:
+        return array
+
+    # Verify the array ended up in internal RAM.
+    if is_in_external_ram(array):
+        raise MemoryError("not enough space in internal RAM for array")
+    return array
+
 def external_ram_max_bytes_per_second():
     """
     Estimates the maximum bytes per second for external RAM access.
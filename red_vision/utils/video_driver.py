@@ -29,7 +29,8 @@ class VideoDriver():
             height (int, optional): Image height in pixels
             width (int, optional): Image width in pixels
             color_mode (int, optional): Color mode to use
-            buffer (ndarray, optional): Pre-allocated image buffer
+            buffer (ndarray or list, optional): Pre-allocated image buffer, or
+                a list of buffers for drivers that support multiple buffers
         """
         # Determine image resolution.
         if height is None or width is None:
@@ -56,18 +57,26 @@ class VideoDriver():
             # Store the color mode.            
             self._color_mode = color_mode
 
-        # Create or store the image buffer.
+        # Create or store the image buffer(s).
         self._bytes_per_pixel = rv_colors.bytes_per_pixel(self._color_mode)
         buffer_shape = (self._height, self._width, self._bytes_per_pixel)
         if buffer is None:
             # No buffer provided, create a new one.
-            self._buffer = np.zeros(buffer_shape, dtype=np.uint8)
+            self._buffers = [np.zeros(buffer_shape, dtype=np.uint8)]
         else:
-            # Use the provided buffer, formatted as a NumPy ndarray.
-            self._buffer = np.frombuffer(buffer, dtype=np.uint8)
+            # A single buffer is treated as a list of one buffer.
+            if type(buffer) is not list and type(buffer) is not tuple:
+                buffer = [buffer]
 
-            # Reshape to the provided dimensions.
-            self._buffer = self._buffer.reshape(buffer_shape)
+            # Use the provided buffers, formatted as NumPy ndarrays and
+            # reshaped to the provided dimensions.
+            self._buffers = []
+            for b in buffer:
+                b = np.frombuffer(b, dtype=np.uint8)
+                self._buffers.append(b.reshape(buffer_shape))
+
+        # The first buffer is the main image buffer.
+        self._buffer = self._buffers[0]
 
     def buffer(self):
         """
@@ -78,6 +87,16 @@ class VideoDriver():
         """
         return self._buffer
 
+    def buffers(self):
+        """
+        Returns all image buffers used by the driver. Most drivers only use a
+        single buffer, which is the same as `buffer()`.
+
+        Returns:
+            list: Image buffers
+        """
+        return self._buffers
+
     def color_mode(self):
         """
         Returns the current color mode of the driver.
@@ -14,6 +14,9 @@
 import cv2 as cv
 from rv_init import display, camera
 
+# Import the key press utility to check for key presses without waiting
+from red_vision.utils.keys import poll_key
+
 # Open a camera, similar to any other Python environment! In standard OpenCV,
 # you would use `cv.VideoCapture(0)` or similar, and OpenCV would leverage the
 # host operating system to open a camera object and return it as a
@@ -41,8 +44,9 @@ while True:
     # Display the frame
     cv.imshow(display, frame)
 
-    # Check for key presses
-    key = cv.waitKey(1)
+    # Check for key presses. `poll_key()` returns immediately if no key was
+    # pressed, unlike `cv.waitKey(1)` which always waits at least 1 ms
+    key = poll_key()
 
     # If any key is pressed, exit the loop
     if key != -1:
@@ -17,53 +17,119 @@ from rv_init import display, touch_screen
 # Import NumPy
 from ulab import numpy as np
 
-# Initialize an image to draw on
-img = np.zeros((240, 320, 3), dtype=np.uint8)
+# Import MicroPython to compile functions to machine code
+import micropython
+
+# Import the memory utilities to allocate arrays in internal RAM
+from red_vision.utils.memory import alloc_internal_ram
+
+# Import the key press utility to check for key presses without waiting
+from red_vision.utils.keys import poll_key
+
+# Initialize an image to draw on. It's allocated in internal RAM, which is
+# faster to access than external PSRAM on boards that have it
+img = alloc_internal_ram((240, 320, 3), dtype=np.uint8)
 
 # Prompt the user to draw on the screen
 img = cv.putText(img, "Touch to draw!", (10, 30), cv.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
 
+# Display the initial image
+display.imshow(img)
+
 # Prompt the user to press a key to continue
 print("Press any key to continue")
 
-# Create variables to store touch coordinates and state
-x0, y0, x1, y1 = 0, 0, 0, 0
-touch_input = False
+# The touch points are processed in a function decorated with
+# `@micropython.native`, which compiles it to machine code instead of bytecode.
+# This makes plain Python logic like this run significantly faster
+@micropython.native
+def process_touch_points(points, last_point):
+    """
+    Splits touch points into strokes, separated by touch releases (None), and
+    determines the region of the image that the strokes cover.
+
+    Returns:
+        tuple: (strokes, last_point, rect)
+    """
+    strokes = []
+    stroke = []
+    x_min, y_min, x_max, y_max = 100000, 100000, -1, -1
+    if last_point is not None:
+        # Continue the stroke from the last loop iteration
+        stroke.append(last_point)
+        x_min, y_min = last_point
+        x_max, y_max = last_point
+    for point in points:
+        if point is None:
+            # The touch was released, end the current stroke
+            if len(stroke) > 0:
+                strokes.append(stroke)
+            stroke = []
+        else:
+            stroke.append(point)
+            x, y = point
+            if x < x_min:
+                x_min = x
+            if x > x_max:
+                x_max = x
+            if y < y_min:
+                y_min = y
+            if y > y_max:
+                y_max = y
+    if len(stroke) > 0:
+        strokes.append(stroke)
+        last_point = stroke[-1]
+    else:
+        last_point = None
+
+    # Add a margin for the line thickness
+    margin = 2
+    rect = (x_min - margin, y_min - margin, x_max - x_min + 2 * margin + 1, y_max - y_min + 2 * margin + 1)
+    return strokes, last_point, rect
+
+# Looking up attributes takes time in MicroPython, so cache the bound methods
+# that are called every loop iteration
+read_touch_points = touch_screen.read_touch_points
+imshow_rect = display.imshow_rect
+
+# Create a variable to store the last touch point, or None if not touching
+last_point = None
 
 # Loop to continuously read touch input and draw on the image
 while True:
-    # Check if there is touch input
-    if touch_screen.is_touched():
-        # Check if this is the first touch or a continuation
-        if not touch_input:
-            # This is the first touch, set both (x0, y0) and (x1, y1) to the
-            # initial touch coordinates. This will draw a point at the touch
-            # location if no further touch inputs are made
-            x0, y0 = touch_screen.get_touch_xy()
-            x1, y1 = x0, y0
-            # Set the state to indicate there is touch input
-            touch_input = True
-        else:
-            # This is a continuation of the touch, set (x0, y0) to the previous
-            # coordinates and set (x1, y1) to the current touch coordinates so
-            # we can draw a line between them
-            x0, y0 = x1, y1
-            x1, y1 = touch_screen.get_touch_xy()
+    # Read all touch points since the last loop iteration. If the touch screen
+    # was given an interrupt pin, this includes every touch point that occurred
+    # since the last call, so fast strokes are drawn without gaps
+    points = read_touch_points()
+
+    # Nothing to draw if there are no new touch points
+    if len(points) > 0:
+        strokes, last_point, rect = process_touch_points(points, last_point)
     else:
-        # Check if there was touch input before
-        if touch_input:
-            # There was touch input before, but not anymore
-            touch_input = False
+        strokes = []
 
-    # Draw a line if there was touch input
-    if touch_input:
-        img = cv.line(img, (x0, y0), (x1, y1), (255, 255, 255), 2)
+    # Draw all strokes with a single call
+    dirty = False
+    if len(strokes) > 0:
+        pts = []
+        for stroke in strokes:
+            # A stroke with only 1 point needs a second point to draw a dot at
+            # the touch location
+            if len(stroke) == 1:
+                stroke.append(stroke[0])
+            pts.append(np.array(stroke, dtype=np.float).reshape((len(stroke), 1, 2)))
+        img = cv.polylines(img, pts, False, (255, 255, 255), 2)
+        dirty = True
 
-    # Display the frame
-    display.imshow(img)
+    # Display the image only if it changed, which saves time sending it to the
+    # display. Only the changed region needs to be sent, which is much faster
+    # than sending the whole image
+    if dirty:
+        imshow_rect(img, rect)
 
-    # Check for key presses
-    key = cv.waitKey(1)
+    # Check for key presses. `poll_key()` returns immediately if no key was
+    # pressed, unlike `cv.waitKey(1)` which always waits at least 1 ms
+    key = poll_key()
 
     # If any key is pressed, exit the loop
     if key != -1:
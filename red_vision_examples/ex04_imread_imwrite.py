@@ -15,6 +15,9 @@
 import cv2 as cv
 from rv_init import display
 
+# Import NumPy to create arrays
+from ulab import numpy as np
+
 # Call `cv.imread()` to read an image from the MicroPython filesystem, just
 # like in any other Python environment! Make sure to copy the image to the
 # MicroPython filesystem first, and set the path to the image file as needed
@@ -39,8 +42,13 @@ key = cv.waitKey(0)
 
 # Let's modify the image! Here we use `cv.Canny()` to perform edge detection
 # on the image, which is a common operation in computer vision
+# 
+# The output array is preallocated and passed to `cv.Canny()`, so OpenCV writes
+# the result into it instead of allocating a new array. The edges image has the
+# same size as the original image, but only 1 channel
 print("Performing edge detection...")
-edges = cv.Canny(img, 100, 200)
+edges = np.zeros(img.shape[:2], dtype=np.uint8)
+edges = cv.Canny(img, 100, 200, edges)
 
 # Display the modified image
 cv.imshow(display, edges)
@@ -27,6 +27,12 @@ import time
 # Import garbage collector to measure memory usage
 import gc
 
+# Import the memory utilities to allocate arrays in internal RAM
+from red_vision.utils.memory import alloc_internal_ram
+
+# Import the key press utility to check for key presses without waiting
+from red_vision.utils.keys import poll_key
+
 # Many OpenCV functions can take an optional output argument to store the result
 # of the operation. If it's not provided, OpenCV allocates a new array to store
 # the result, which can be slow and waste memory. When it is provided, OpenCV
@@ -38,8 +44,18 @@ import gc
 # the shapes or data types are incorrect, OpenCV will simply allocate new arrays
 # for each on the first loop iteration. The variables will then be re-assigned,
 # so this only negatively affects the first loop iteration.
-frame = np.zeros((240, 320, 3), dtype=np.uint8)
-result_image = np.zeros((240, 320, 3), dtype=np.uint8)
+# 
+# On boards with external PSRAM, arrays can end up in PSRAM, which is much
+# slower to access than the internal SRAM. `alloc_internal_ram()` ensures the
+# arrays are in SRAM, and raises a `MemoryError` if there's not enough space.
+frame = alloc_internal_ram((240, 320, 3), dtype=np.uint8)
+
+# Looking up module attributes like `cv.FONT_HERSHEY_SIMPLEX` and creating
+# tuples takes time in MicroPython, so any constant arguments used in the main
+# loop can be created once beforehand and reused every loop iteration
+text_font = cv.FONT_HERSHEY_SIMPLEX
+text_origin = (10, 30)
+text_color = (255, 255, 255)
 
 # Open the camera
 camera.open()
@@ -68,11 +84,16 @@ while True:
         print("Failed to read frame from camera")
         break
 
-    # Now we'll do some processing on the frame. Try running this with and
-    # without the pre-allocated `result_image` array, and try different OpenCV
-    # functions to compare performance
+    # Now we'll do some processing on the frame. Try different OpenCV functions
+    # to compare performance
+    # 
+    # Some operations process each pixel independently and don't change the
+    # shape of the image, like this BGR to HSV conversion. These can be done
+    # "in place" by passing the same array as both the input and output, which
+    # avoids needing a second array and saves a lot of memory. The original
+    # frame is overwritten, so only do this if it's no longer needed
     t0 = time.ticks_us()
-    result_image = cv.cvtColor(frame, cv.COLOR_BGR2HSV, result_image)
+    frame = cv.cvtColor(frame, cv.COLOR_BGR2HSV, frame)
     t1 = time.ticks_us()
     print("Processing: %.2f ms" % ((t1 - t0) / 1_000), end='\t')
 
@@ -85,10 +106,10 @@ while True:
     fps = 1_000_000 / (current_time - loop_time)
     loop_time = current_time
     print("FPS: %.2f" % fps, end='\t')
-    result_image = cv.putText(result_image, f"FPS: {fps:.2f}", (10, 30), cv.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+    frame = cv.putText(frame, f"FPS: {fps:.2f}", text_origin, text_font, 1, text_color, 2)
 
     # Display the frame
-    cv.imshow(display, result_image)
+    cv.imshow(display, frame)
 
     # We can also measure memory usage to see how much RAM is being consumed by
     # this code. If you remove the output arguments from the functions above,
@@ -126,8 +147,15 @@ while True:
     # your application can make use of the native color spaces and improve
     # overall performance
 
-    # Check for key presses
-    key = cv.waitKey(1)
+    # If the camera is in continuous mode, it can also be given a list of image
+    # buffers in `rv_init/camera.py`, which are filled by the camera in turn.
+    # `camera.read()` then returns the most recently completed frame without
+    # waiting for a whole new frame to be captured, so the camera capture and
+    # the processing in this loop happen at the same time
+
+    # Check for key presses. `poll_key()` returns immediately if no key was
+    # pressed, unlike `cv.waitKey(1)` which always waits at least 1 ms
+    key = poll_key()
 
     # If any key is pressed, exit the loop
     if key != -1:
@@ -29,6 +29,39 @@ from ulab import numpy as np
 # Import time for frame rate calculation
 import time
 
+# Import math for the shape matching calculations
+import math
+
+# Import garbage collector to control when garbage collection happens
+import gc
+
+# Import the key press utility to check for key presses without waiting
+from red_vision.utils.keys import poll_key
+
+# Looking up a function in a module (eg. `cv.putText`) takes some time in
+# MicroPython, so the functions called for every frame are looked up once here
+cvtColor = cv.cvtColor
+resize = cv.resize
+threshold = cv.threshold
+inRange = cv.inRange
+absdiff = cv.absdiff
+countNonZero = cv.countNonZero
+morphologyEx = cv.morphologyEx
+findContours = cv.findContours
+contourArea = cv.contourArea
+boundingRect = cv.boundingRect
+arcLength = cv.arcLength
+approxPolyDP = cv.approxPolyDP
+moments = cv.moments
+HuMoments = cv.HuMoments
+drawContours = cv.drawContours
+rectangle = cv.rectangle
+drawMarker = cv.drawMarker
+putText = cv.putText
+imshow = cv.imshow
+ticks_us = time.ticks_us
+ticks_diff = time.ticks_diff
+
 # Here we define a reference contour for the SparkFun flame logo. This was
 # created manually by picking points on the boundary of a small image of the
 # logo in an image editor. Below is also ASCII art of the logo for reference,
@@ -69,125 +102,384 @@ logo_contour = np.array(
      [[20,36]],
      [[12,36]]], dtype=np.float)
 
-# This is the pipeline implementation. This gets called for each frame captured
-# by the camera in the main loop
-def sfe_logo_detection_pipeline(frame):
+# Below is the same shape comparison that `cv.matchShapes()` performs with the
+# `cv.CONTOURS_MATCH_I2` method. It compares the 7 Hu moments of both contours,
+# which describe the shape independently of its position, size, and rotation.
+# `cv.matchShapes()` computes the Hu moments of both contours every time it's
+# called, but the reference logo contour never changes, so we can compute its
+# Hu moments just once here and only compute the other contour's each time
+def hu_log_moments(contour):
+    # Compute the Hu moments of the contour, and convert them to a log scale.
+    # Moments that are too small to compare are set to None
+    hu = HuMoments(moments(contour)).flatten()
+    log_hu = []
+    for h in hu:
+        if abs(h) > 1e-5:
+            sign = 1 if h > 0 else -1
+            log_hu.append(sign * math.log10(abs(h)))
+        else:
+            log_hu.append(None)
+    return log_hu
+
+logo_log_hu = hu_log_moments(logo_contour)
+
+# The reference logo contour is drawn in the top left corner of every frame. It
+# never changes, so it's drawn once here onto a small black tile, which can then
+# be copied into each frame much faster than drawing the contour every time
+logo_tile = np.zeros((50, 40, 3), dtype=np.uint8)
+drawContours(logo_tile, [logo_contour], -1, (255, 255, 255), 1, offset=(2, 2))
+
+# Comparing shapes takes some time, so it's more efficient to first skip
+# contours that are obviously the wrong size or shape. The logo can appear at
+# any size and rotation, so we only skip contours that are too small to be the
+# logo, too large (eg. the border of the image), or much too long and thin
+# compared to the logo. The expected aspect ratio is computed from the reference
+# contour's bounding box, allowing for the logo to be rotated
+LOGO_AREA_MIN = 100 # In pixels of the full size image
+LOGO_AREA_MAX_FRACTION = 0.5
+logo_left, logo_top, logo_width, logo_height = boundingRect(logo_contour)
+LOGO_ASPECT_HI = 1.5 * max(logo_height / logo_width, logo_width / logo_height)
+LOGO_ASPECT_LO = 1 / LOGO_ASPECT_HI
+
+def match_logo_shape(contour):
+    # Sum the differences between the log scale Hu moments of the logo and the
+    # contour, skipping any moments that are too small. This returns a
+    # "similarity" score between the two shapes. The lower the score, the more
+    # similar the shapes are
+    similarity = 0
+    for logo_m, contour_m in zip(logo_log_hu, hu_log_moments(contour)):
+        if logo_m is not None and contour_m is not None:
+            similarity += abs(logo_m - contour_m)
+    return similarity
+
+# This is the first step of the pipeline, which is also used to calibrate the
+# pipeline (see below). If the camera captures grayscale images, the
+# grayscale image can be provided to skip converting the frame to grayscale
+def preprocess(frame, gray=None):
+    # First we convert the image to grayscale (if needed) and shrink it to half
+    # the width and height. The logo is still easily detectable at this size,
+    # and every following step has only a quarter as many pixels to process,
+    # which makes the whole pipeline much faster. `cv.INTER_AREA` averages each
+    # 2x2 block of pixels, which also reduces noise
+    if gray is None:
+        gray = cvtColor(frame, cv.COLOR_BGR2GRAY)
+    return resize(gray, (gray.shape[1] // 2, gray.shape[0] // 2), interpolation=cv.INTER_AREA)
+
+# The pipeline keeps pixels darker than a threshold (see below). This determines
+# the threshold from a small grayscale image using Otsu's thresholding method,
+# which automatically picks the threshold that best separates dark and light
+# pixels. Otsu's method takes extra time to compute, so it's only done before
+# the main loop, and again if the logo hasn't been found for a while in case the
+# lighting has changed
+def calibrate(small):
+    global logo_dark_max
+    logo_dark_max, thresh = threshold(small, 0, 255, cv.THRESH_BINARY_INV | cv.THRESH_OTSU)
+
+# Kernel for removing noise from the binary image, see below
+open_kernel = np.ones((3, 3), dtype=np.uint8)
+
+# This finds the contour that best matches the logo in the small grayscale image,
+# and returns it and its bounding rectangle scaled to the full size image. If no
+# contour is a good enough match, None is returned
+def find_logo(small):
     # Here we binarize the image. There are many ways to do this, but here we
-    # simply convert the image to grayscale and then apply Otsu's thresholding
-    # method to create a binary image. This means it will only detect a dark
-    # logo on a light background (or vice versa), but you can modify this to
-    # find specific colors or use other methods if desired
-    gray = cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
-    ret, thresh = cv.threshold(gray, 0, 255, cv.THRESH_BINARY | cv.THRESH_OTSU)
+    # simply keep all pixels darker than a threshold, which is determined by
+    # `calibrate()`. This means it will only detect a dark logo on a light
+    # background, but you can modify this to find specific colors or use other
+    # methods if desired
+    thresh = inRange(small, 0, logo_dark_max)
+
+    # Noise in the image can create many tiny specks in the binary image, and
+    # each one becomes a contour that needs to be checked. A morphological
+    # "open" removes specks smaller than the kernel, while keeping larger shapes
+    # like the logo mostly unchanged
+    thresh = morphologyEx(thresh, cv.MORPH_OPEN, open_kernel, thresh)
 
     # Find contours in the binary image, which are simply lists of points around
     # the boundaries of shapes. Contours are a powerful tool in OpenCV for shape
     # analysis and object detection
-    contours, hierarchy = cv.findContours(thresh, cv.RETR_TREE, cv.CHAIN_APPROX_SIMPLE)
+    # 
+    # `cv.RETR_LIST` is used rather than `cv.RETR_EXTERNAL`, because the logo
+    # isn't always an outer contour. If a dark background surrounds the light
+    # paper, the paper becomes a hole in the binary image and the logo is nested
+    # inside it. The extra contours this returns, like the large background, are
+    # quickly rejected by the checks below. `cv.CHAIN_APPROX_TC89_KCOS`
+    # approximates each contour with fewer points than `cv.CHAIN_APPROX_SIMPLE`,
+    # which makes the following steps faster
+    contours, hierarchy = findContours(thresh, cv.RETR_LIST, cv.CHAIN_APPROX_TC89_KCOS)
 
     # It's possible that no contours were found, so first check if any were
     # found before proceeding
-    if contours:
-        # We'll compare the contours found in the image to the reference logo
-        # contour defined earlier. We will use the `cv.matchShapes()` function
-        # to compare the shapes to pick the best match, so we need to initialize
-        # variables to keep track of the best match found so far
-        best_contour = None
-        best_similarity = float('inf') # Start with a very high similarity score
-
-        # Loop through each contour found in the image to find the best match
-        for i in range(len(contours)):
-            # If the image is noisy, the binarized image may contain many tiny
-            # contours that are obviously not the logo. `cv.matchShapes()` can
-            # take some time, so we can be more efficient by skipping obviously
-            # wrong contours. In this example, the logo we're looking for is
-            # fairly complex, so we can skip contours that have too few points
-            # since they will definitely be too simple to match the logo
-            if len(contours[i]) < 20:
-                continue
-
-            # Now we call `cv.matchShapes()` which returns a "similarity" score
-            # between the two shapes. The lower the score, the more similar the
-            # shapes are
-            similarity = cv.matchShapes(logo_contour, contours[i], cv.CONTOURS_MATCH_I2, 0)
-
-            # Check if this contour is a better match than the best so far
-            if similarity < best_similarity:
-                # This contour is a better match, so update the best match
-                best_similarity = similarity
-                best_contour = contours[i]
-        
-        # We're done checking all contours. It's possible that the best contour
-        # found is not a good match, so we can check if the score is below a
-        # threshold to determine whether it's close enough. Testing has shown
-        # that good matches are usually around 0.5, so we'll use a slightly
-        # higher threshold of 1.0
-        if best_similarity < 1.0:
-            # The best contour found is a good match, so we'll draw it on the
-            # frame to outline the detected logo for visualization
-            frame = cv.drawContours(frame, [best_contour], -1, (0, 0, 255), 2)
-
-            # Visualization is great, but the purpose of most real pipelines is
-            # to extract useful data from the image. For example, suppose we
-            # want to know where the logo is located in the image and how large
-            # it is. We can use the bounding rectangle of the contour to get the
-            # position and size of the logo
-            left, top, width, height = cv.boundingRect(best_contour)
-            center_x = left + width // 2
-            center_y = top + height // 2
-
-            # Now we could use this data for some task! For example, if we were
-            # detecting an object that a robot needs to drive in front of, we
-            # could turn to face it with the center point, then drive forwards
-            # until the size is big enough (meaning we're close enough to it).
-            #
-            # This example doesn't actually make use of the data, so we'll just
-            # draw the bounding box and center of the logo for visualization,
-            # and add text of the position and size of the logo
-            frame = cv.rectangle(frame, (left, top), (left + width, top + height), (255, 0, 0), 2)
-            frame = cv.drawMarker(frame, (center_x, center_y), (0, 255, 0), cv.MARKER_CROSS, 10, 2)
-            frame = cv.putText(frame, f"({center_x}, {center_y})", (center_x - 45, center_y - 10), cv.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-            frame = cv.putText(frame, f"{width}x{height}", (left, top - 10), cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
-
-# Initialize a loop timer to calculate processing speed in FPS
-loop_time = time.ticks_us()
+    if not contours:
+        return None
+
+    # We'll compare the contours found in the image to the reference logo
+    # contour defined earlier. We will use the `match_logo_shape()` function
+    # to compare the shapes to pick the best match, so we need to initialize
+    # variables to keep track of the best match found so far
+    best_contour = None
+    best_bbox = None
+    best_similarity = float('inf') # Start with a very high similarity score
+
+    # Contours larger than this fraction of the image are too large to be
+    # the logo. The contours are found in the half size image, so the areas
+    # are a quarter of the full size image
+    area_min = LOGO_AREA_MIN / 4
+    area_max = LOGO_AREA_MAX_FRACTION * thresh.shape[0] * thresh.shape[1]
+
+    # If the image is noisy, the binarized image may contain many tiny
+    # contours that are obviously not the logo. `match_logo_shape()` can
+    # take some time, so we can be more efficient by skipping obviously
+    # wrong contours. In this example, the logo we're looking for is fairly
+    # complex, so we can skip contours that have too few points since they
+    # will definitely be too simple to match the logo. We also skip contours
+    # that are too small or too large. A list comprehension is used to
+    # filter the contours, which runs faster in MicroPython than checking
+    # each contour in a regular loop
+    candidates = [c for c in contours if len(c) >= 10 and area_min <= contourArea(c) <= area_max]
+
+    # Loop through each remaining contour to find the best match
+    for contour in candidates:
+        # Skip contours with an aspect ratio very different from the logo.
+        # This is much faster to check than comparing the shapes
+        bbox = boundingRect(contour)
+        left, top, width, height = bbox
+        aspect = height / width
+        if aspect < LOGO_ASPECT_LO or aspect > LOGO_ASPECT_HI:
+            continue
+
+        # Contours found in the image can have many more points than the
+        # reference logo contour, and computing the Hu moments takes longer
+        # with more points. `cv.approxPolyDP()` simplifies the contour by
+        # removing points that barely change its shape. The maximum allowed
+        # change is a small fraction of the contour's length, so corners
+        # of the logo are kept and the Hu moments are nearly unchanged
+        epsilon = 0.005 * arcLength(contour, True)
+        contour = approxPolyDP(contour, epsilon, True)
+
+        # Now we call `match_logo_shape()` which returns a "similarity"
+        # score between the two shapes. The lower the score, the more
+        # similar the shapes are
+        similarity = match_logo_shape(contour)
+
+        # Check if this contour is a better match than the best so far
+        if similarity < best_similarity:
+            # This contour is a better match, so update the best match
+            best_similarity = similarity
+            best_contour = contour
+            best_bbox = bbox
+
+            # A score this low is an unmistakable match, so there's no need
+            # to check the remaining contours
+            if best_similarity < 0.1:
+                break
+    
+    # We're done checking all contours. It's possible that the best contour
+    # found is not a good match, so we can check if the score is below a
+    # threshold to determine whether it's close enough. Testing has shown
+    # that good matches are usually around 0.5, so we'll use a slightly
+    # higher threshold of 1.0
+    if best_similarity >= 1.0:
+        return None
+
+    # The best contour found is a good match. It was found in the half size
+    # image, so scale it back to full size. The bounding rectangle from the
+    # aspect ratio check above is scaled too, rather than computing it again
+    left, top, width, height = best_bbox
+    return best_contour * 2, (left * 2, top * 2, width * 2, height * 2)
+
+# Detecting the logo takes much longer than the rest of the pipeline, but if the
+# camera is not moving and nothing in view changes, the result will be the same
+# as last time. So the small grayscale image used for the last detection is kept
+# along with the result, and detection is only run again if enough pixels have
+# changed since then. Comparing against the image used for the last detection
+# (rather than the previous frame) ensures slow changes are eventually noticed
+last_small = None
+last_logo = None
+
+# A pixel counts as changed if its brightness differs by more than this amount,
+# which ignores small changes caused by camera noise. Detection is run again if
+# more than this fraction of the pixels have changed
+DIFF_PIXEL_THRESHOLD = 15
+DIFF_CHANGED_FRACTION = 0.01
+
+# This is the pipeline implementation. This gets called for each frame captured
+# by the camera in the main loop
+def sfe_logo_detection_pipeline(frame, gray=None):
+    global last_small, last_logo
+
+    # Preprocess the frame into a small grayscale image
+    small = preprocess(frame, gray)
+
+    # Count how many pixels have changed since the last detection. This only
+    # takes a few fast OpenCV calls, which is much cheaper than detection
+    changed = True
+    if last_small is not None:
+        diff = absdiff(small, last_small)
+        retval, diff = threshold(diff, DIFF_PIXEL_THRESHOLD, 255, cv.THRESH_BINARY, diff)
+        changed_max = DIFF_CHANGED_FRACTION * small.shape[0] * small.shape[1]
+        changed = countNonZero(diff) > changed_max
+
+    # Only run detection if the image has changed, otherwise reuse the result
+    # from last time
+    if changed:
+        last_small = small
+        last_logo = find_logo(small)
+
+    # If the logo was found, we'll draw it on the frame to outline the detected
+    # logo for visualization
+    if last_logo is not None:
+        best_contour, best_bbox = last_logo
+
+        # Drawing functions modify the image in place, so there's no need
+        # to re-assign `frame` with the returned image
+        drawContours(frame, [best_contour], -1, (0, 0, 255), 2)
+
+        # Visualization is great, but the purpose of most real pipelines is
+        # to extract useful data from the image. For example, suppose we
+        # want to know where the logo is located in the image and how large
+        # it is. We can use the bounding rectangle of the contour to get the
+        # position and size of the logo
+        left, top, width, height = best_bbox
+        center_x = left + width // 2
+        center_y = top + height // 2
+
+        # Now we could use this data for some task! For example, if we were
+        # detecting an object that a robot needs to drive in front of, we
+        # could turn to face it with the center point, then drive forwards
+        # until the size is big enough (meaning we're close enough to it).
+        #
+        # This example doesn't actually make use of the data, so we'll just
+        # draw the bounding box and center of the logo for visualization,
+        # and add text of the position and size of the logo
+        rectangle(frame, (left, top), (left + width, top + height), (255, 0, 0), 2)
+        drawMarker(frame, (center_x, center_y), (0, 255, 0), cv.MARKER_CROSS, 10, 2)
+        putText(frame, f"({center_x}, {center_y})", (center_x - 45, center_y - 10), cv.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+        putText(frame, f"{width}x{height}", (left, top - 10), cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
+
+# Initialize a loop timer to calculate processing speed in FPS. The frame time
+# is averaged over several frames so the displayed FPS doesn't jump around
+loop_time = ticks_us()
+frame_time_avg = 0
+
+# Initialize a frame counter to periodically run garbage collection
+frame_count = 0
+
+# Initialize a counter of frames in a row where the logo wasn't found, which is
+# used to decide when to recalibrate
+frames_without_logo = 0
 
 # Open the camera
 camera.open()
 
+# The camera's exposure takes a moment to settle after it's opened, so the
+# first few frames are read and discarded before calibrating
+frame = None
+for i in range(5):
+    success, frame = camera.read(frame)
+
+# Before the main loop, we calibrate the threshold for dark pixels from a single
+# frame. Make sure the logo and background are in view when the example starts
+success, frame = camera.read(frame)
+if not success:
+    raise RuntimeError("Failed to read calibration frame from camera")
+if frame.shape[2] == 1:
+    calibrate(preprocess(None, frame))
+else:
+    calibrate(preprocess(frame))
+
+# The calibration frame is passed back into `camera.read()`, so every following
+# frame is read into the same array instead of allocating a new one each time.
+# If the camera captures grayscale images, the BGR image they're converted to is
+# also created once and reused
+camera_frame = frame
+bgr_frame = None
+
 # Prompt the user to press a key to continue
 print("Press any key to continue")
 
 # Loop to continuously read frames from the camera and display them
 while True:
     # Read a frame from the camera
-    success, frame = camera.read()
+    success, camera_frame = camera.read(camera_frame)
     if not success:
         print("Failed to read frame from camera")
         break
-    
+
+    # The pipeline only needs a grayscale image. Some cameras (eg. the OV5640)
+    # can capture grayscale images directly by setting the color mode to
+    # `rv.colors.COLOR_MODE_GRAY8` in `rv_init/camera.py`, which avoids a
+    # conversion every frame. The frame is still converted to BGR so the
+    # results can be drawn in color
+    gray = None
+    frame = camera_frame
+    if frame.shape[2] == 1:
+        gray = frame
+        if bgr_frame is None:
+            bgr_frame = np.zeros((gray.shape[0], gray.shape[1], 3), dtype=np.uint8)
+        frame = cvtColor(gray, cv.COLOR_GRAY2BGR, bgr_frame)
+
     # Call the pipeline function to process the frame
-    sfe_logo_detection_pipeline(frame)
+    sfe_logo_detection_pipeline(frame, gray)
+
+    # Count how many frames in a row the logo hasn't been found
+    if last_logo is None:
+        frames_without_logo += 1
+    else:
+        frames_without_logo = 0
 
     # All processing is done! Calculate the frame rate and display it
-    current_time = time.ticks_us()
-    fps = 1_000_000 / (current_time - loop_time)
+    # 
+    # Formatting floats is relatively slow in MicroPython, and creating new
+    # strings allocates memory, so the FPS is shown as an integer with simple
+    # string concatenation
+    #
+    # The frame time is smoothed with an exponential moving average, which
+    # gives the new frame time a weight of 1/8. Only integer math is used,
+    # with a bit shift instead of dividing by 8. `ticks_diff()` handles the
+    # tick counter wrapping around, and the average is kept at least 1 us to
+    # avoid dividing by zero
+    current_time = ticks_us()
+    frame_time = ticks_diff(current_time, loop_time)
     loop_time = current_time
-    frame = cv.putText(frame, f"FPS: {fps:.2f}", (40, 30), cv.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
+    if frame_time_avg == 0:
+        frame_time_avg = frame_time
+    else:
+        frame_time_avg = (frame_time_avg * 7 + frame_time) >> 3
+    frame_time_avg = max(frame_time_avg, 1)
+    fps = 1_000_000 // frame_time_avg
+    putText(frame, "FPS:" + str(fps), (40, 30), cv.FONT_HERSHEY_SIMPLEX, 1, (0, 0, 255), 2)
 
-    # Draw the reference logo contour in the top left corner of the frame
-    frame[0:50, 0:40] = (0,0,0)
-    frame = cv.drawContours(frame, [logo_contour], -1, (255, 255, 255), 1, offset=(2, 2))
+    # Copy the reference logo tile into the top left corner of the frame
+    frame[0:50, 0:40] = logo_tile
 
     # Display the frame
-    cv.imshow(display, frame)
+    imshow(display, frame)
 
-    # Check for key presses
-    key = cv.waitKey(1)
+    # Check for key presses. `poll_key()` returns immediately if no key was
+    # pressed, unlike `cv.waitKey(1)` which always waits at least 1 ms
+    key = poll_key()
 
     # If any key is pressed, exit the loop
     if key != -1:
         break
 
+    # Garbage collection runs automatically when memory runs low, which could
+    # happen in the middle of processing a frame and cause a stutter. Running
+    # it every 30 frames at this point keeps the pauses short and predictable
+    frame_count += 1
+    if frame_count >= 30:
+        frame_count = 0
+        gc.collect()
+
+        # If the logo hasn't been found for a while, the lighting may have
+        # changed since the last calibration, so recalibrate with the image
+        # used for the last detection. That image is then cleared, so detection
+        # runs again on the next frame with the new threshold
+        if frames_without_logo >= 30 and last_small is not None:
+            calibrate(last_small)
+            last_small = None
+            frames_without_logo = 0
+
 # Release the camera
 camera.release()
@@ -16,6 +16,9 @@
 import cv2 as cv
 from rv_init import display
 
+# Import the key press utility to check for key presses without waiting
+from red_vision.utils.keys import poll_key
+
 # Load an animation sheet image that contains multiple frames of an animation
 animation_sheet = cv.imread("red_vision_examples/images/animation_sheet.png")
 
@@ -26,35 +29,47 @@ frame_height = 240
 # the frame height
 frame_num = animation_sheet.shape[0] // frame_height
 
-# Initialize variables to keep track of the current row in the sheet and the
-# direction of animation playback (up or down)
-row_index = 0
-direction = 1
+# Split the sheet into a list of frames. Slicing a NumPy array creates a "view"
+# of the original array without copying any data, so this takes almost no extra
+# memory, and avoids calculating the slice for each frame in the main loop
+frames = []
+for i in range(frame_num):
+    row_start_px = i * frame_height
+    row_end_px = row_start_px + frame_height
+    frames.append(animation_sheet[row_start_px:row_end_px, :])
+
+# The animation plays forwards through the sheet, then backwards, and repeats.
+# Instead of keeping track of the playback direction in the main loop, we build
+# the whole playback sequence of frames once here. Going backwards skips the
+# first and last frames, so they're not shown twice in a row
+order = list(range(frame_num)) + list(range(frame_num - 2, 0, -1))
+sequence = [frames[i] for i in order]
+sequence_len = len(sequence)
+
+# Initialize a variable to keep track of the current position in the sequence
+sequence_index = 0
+
+# Looking up a function in a module (eg. `cv.imshow`) takes some time in
+# MicroPython, so the function called for every frame is looked up once here
+imshow = cv.imshow
 
 # Prompt the user to press a key to continue
 print("Press any key to continue")
 
 # Loop to continuously play the animation
 while True:
-    # Calculate the starting and ending pixel row for the current frame
-    row_start_px = row_index * frame_height
-    row_end_px = row_start_px + frame_height
-    cv.imshow(display, animation_sheet[row_start_px:row_end_px, :])
-
-    # Update the row index based on the direction of playback
-    row_index += direction
-
-    # If we reach the end of the sheet, reverse the direction
-    if row_index == frame_num-1:
-        direction = -1
-    elif row_index == 0:
-        direction = 1
-
-    # Check for key presses. If you want the animation to play at a specific
-    # frame rate, you can change the wait time to slow it down. This example
-    # plays the animation as fast as possible, which is often needed to look
-    # smooth in MicroPython
-    key = cv.waitKey(1)
+    # Show the current frame
+    imshow(display, sequence[sequence_index])
+
+    # Move to the next frame in the sequence, wrapping around at the end
+    sequence_index = (sequence_index + 1) % sequence_len
+
+    # Check for key presses. This example plays the animation as fast as
+    # possible, which is often needed to look smooth in MicroPython, so
+    # `poll_key()` is used to return immediately if no key was pressed. If you
+    # want the animation to play at a specific frame rate, you can use
+    # `cv.waitKey()` with a longer wait time to slow it down instead
+    key = poll_key()
 
     # If any key is pressed, exit the loop
     if key != -1:
@@ -31,6 +31,9 @@ from ulab import numpy as np
 # Import the Pin class for the board's default pins, as well as SPI and I2C.
 from machine import Pin, SPI, I2C
 
+# Import the key press utility to check for key presses without waiting.
+from red_vision.utils.keys import poll_key
+
 # When the Red Vision Kit for RedBoard is used with the IoT RedBoard RP2350,
 # both the display and camera use GPIO 16-47 instead of GPIO 0-31, so we need to
 # adjust the base GPIO for PIO drivers.
@@ -46,25 +49,32 @@ width = 320
 color_mode = rv.colors.COLOR_MODE_BGR565
 bytes_per_pixel = rv.colors.bytes_per_pixel(color_mode)
 
-# Create the image buffer to be shared between the camera and display.
-shared_buffer = np.zeros(
+# Create the image buffer to be shared between the camera and display. It must
+# be located in SRAM, because if it's in external PSRAM, it probably won't work
+# due to the QSPI bus becoming bottlenecked by both the camera and display
+# trying to access it at the same time. `alloc_internal_ram()` raises a
+# `MemoryError` if there's not enough SRAM available.
+shared_buffer = rv.utils.memory.alloc_internal_ram(
     (height, width, bytes_per_pixel),
     dtype = np.uint8
 )
 
-# Verify that the buffer is located in SRAM. If it's in external PSRAM, it
-# probably won't work due to the QSPI bus becoming bottlenecked by both the
-# camera and display trying to access it at the same time.
-if rv.utils.memory.is_in_external_ram(shared_buffer):
-    raise MemoryError("Buffer must be in internal RAM for this example")
+# Create a flat 16-bit view of the shared buffer, with one element per BGR565
+# pixel. This shares the same memory, so no data is copied. If you want to draw
+# overlays directly into the shared buffer, writing to this view with
+# `shared_pixels[y * width + x] = pixel` avoids creating a new array object for
+# every access, which is much faster than indexing `shared_buffer[y, x]`.
+shared_pixels = np.frombuffer(shared_buffer, dtype = np.uint16)
 
 # Set up and initialize a display. This example uses the ST7789, but you can
 # change this to use any camera and display that support the same resolution and
 # color format. SPI is used here for compatibility with most platforms, but
-# other interfaces can be faster.
+# other interfaces can be faster. The ST7789 supports writes up to 62.5 MHz, and
+# the port clamps the baudrate to the fastest rate it can achieve, so a faster
+# bus lets `show()` return sooner.
 interface_display = rv.displays.SPI_Generic(
     spi = SPI(
-        baudrate = 24_000_000,
+        baudrate = 62_500_000,
     ),
     pin_dc = Pin.board.DISPLAY_DC,
     pin_cs = Pin.board.DISPLAY_CS,
@@ -115,8 +125,9 @@ while True:
     # calling show() is not necessary.
     driver_display.show()
 
-    # Check for key presses.
-    key = cv.waitKey(1)
+    # Check for key presses. `poll_key()` returns immediately if no key was
+    # pressed, unlike `cv.waitKey(1)` which always waits at least 1 ms.
+    key = poll_key()
 
     # If any key is pressed, exit the loop.
     if key != -1:
@@ -14,8 +14,8 @@
 # When the Red Vision Kit for RedBoard is used with the IoT RedBoard RP2350,
 # both the display and camera use GPIO 16-47 instead of GPIO 0-31, so we need to
 # adjust the base GPIO for PIO drivers
-import sys
-if "IoT RedBoard RP2350" in sys.implementation._machine:
+from ._board import IS_IOT_RP2350
+if IS_IOT_RP2350:
     import rp2
     rp2.PIO(1).gpio_base(16)
 
@@ -0,0 +1,16 @@
+#-------------------------------------------------------------------------------
+# SPDX-License-Identifier: MIT
+# 
+# Copyright (c) 2025 SparkFun Electronics
+#-------------------------------------------------------------------------------
+# red_vision_examples/rv_init/_board.py
+# 
+# This example module detects which board is being used, so the other `rv_init`
+# modules can adjust their configuration without repeating the check.
+#-------------------------------------------------------------------------------
+
+import sys
+
+# Whether the board is the IoT RedBoard RP2350, which uses different GPIO pins
+# and SPI buses than other boards with the Red Vision Kit for RedBoard
+IS_IOT_RP2350 = "IoT RedBoard RP2350" in sys.implementation._machine
@@ -12,10 +12,14 @@
 from machine import SPI
 
 # Initialize default SPI bus. You may need to adjust the arguments based on your
-# specific board and configuration
+# specific board and configuration. On most boards, this bus is shared with the
+# SD card, which can't run faster than 25 MHz in SPI mode, so it's kept at
+# 24 MHz. The baudrate is stored so other modules can restore it if they change
+# it
+SPI_BAUDRATE = 24_000_000
 spi = SPI(
     # id = 0,
-    baudrate = 24_000_000, # Use the fastest baudrate you can for best performance!
+    baudrate = SPI_BAUDRATE,
     # sck = 2,
     # mosi = 3,
     # miso = 4,
@@ -23,11 +27,13 @@ spi = SPI(
 
 # Some boards use the same SPI bus for both the display and the SD card, others
 # have separate buses. We'll create a separate `spi_sd` object for the SD card.
-import sys
-if "IoT RedBoard RP2350" in sys.implementation._machine:
+from ._board import IS_IOT_RP2350
+if IS_IOT_RP2350:
+    SPI_SD_BAUDRATE = 24_000_000
     spi_sd = SPI(
         1,
-        baudrate = 24_000_000,
+        baudrate = SPI_SD_BAUDRATE,
     )
 else:
+    SPI_SD_BAUDRATE = SPI_BAUDRATE
     spi_sd = spi
@@ -18,6 +18,9 @@ import red_vision as rv
 # Import the Pin class for the board's default pins.
 from machine import Pin
 
+# Uncomment to import NumPy if you want to create image buffers (see below).
+# from ulab import numpy as np
+
 ################################################################################
 # DVP Camera
 ################################################################################
@@ -60,8 +63,11 @@ driver = rv.cameras.HM01B0(
     # height = 244,
     # width = 324,
 
-    # Optionally specify the image buffer to use.
+    # Optionally specify the image buffer to use. In continuous mode, a list of
+    # buffers can be provided instead, so frames are captured into each buffer
+    # in turn while the previous frame is being processed.
     # buffer = None,
+    # buffer = [np.zeros((244, 324, 1), dtype=np.uint8) for _ in range(3)],
 )
 
 # OV5640 camera.
@@ -76,11 +82,14 @@ driver = rv.cameras.HM01B0(
 #     # height = 240,
 #     # width = 320,
 
-#     # Optionally specify the image color mode.
+#     # Optionally specify the image color mode (BGR565 or GRAY8).
 #     # color_mode = rv.colors.COLOR_MODE_BGR565,
 
-#     # Optionally specify the image buffer to use.
+#     # Optionally specify the image buffer to use. In continuous mode, a list
+#     # of buffers can be provided instead, so frames are captured into each
+#     # buffer in turn while the previous frame is being processed.
 #     # buffer = None,
+#     # buffer = [np.zeros((240, 320, 2), dtype=np.uint8) for _ in range(2)],
 # )
 
 ################################################################################
@@ -26,27 +26,30 @@ from machine import Pin
 # Interface #
 #############
 
-# Import the SPI bus
-from .bus_spi import spi
-
 # Generic SPI interface. This should work on any platform, but it's not always
-# the fastest option (24Mbps on RP2350).
-interface = rv.displays.SPI_Generic(
-    spi = spi,
-    pin_dc = Pin.board.DISPLAY_DC,
-    pin_cs = Pin.board.DISPLAY_CS,
-)
-
-# PIO interface. This is only available on Raspberry Pi RP2 processors,
-# but is much faster than the SPI interface (75Mbps on RP2350).
-# interface = rv.displays.SPI_RP2_PIO(
-#     sm_id = 4,
-#     pin_clk = Pin.board.DISPLAY_CLK,
-#     pin_tx = Pin.board.DISPLAY_TX,
+# the fastest option (24Mbps on RP2350). The ST7789 supports writes up to
+# 62.5 MHz, so if the display has its own SPI bus (not shared with the SD card),
+# you can raise the baudrate; the port clamps it to the fastest rate it can
+# achieve.
+# from .bus_spi import spi
+# spi.init(baudrate = 62_500_000) # Only if the bus is not shared!
+# interface = rv.displays.SPI_Generic(
+#     spi = spi,
 #     pin_dc = Pin.board.DISPLAY_DC,
 #     pin_cs = Pin.board.DISPLAY_CS,
 # )
 
+# PIO interface. This is only available on Raspberry Pi RP2 processors,
+# but is much faster than the SPI interface (75Mbps on RP2350). The pins can
+# still be shared with other devices on the same SPI bus (eg. the SD card).
+interface = rv.displays.SPI_RP2_PIO(
+    sm_id = 4,
+    pin_clk = Pin.board.DISPLAY_CLK,
+    pin_tx = Pin.board.DISPLAY_TX,
+    pin_dc = Pin.board.DISPLAY_DC,
+    pin_cs = Pin.board.DISPLAY_CS,
+)
+
 ##########
 # Driver #
 ##########
@@ -118,4 +121,10 @@ driver = rv.displays.ST7789(
 ################################################################################
 
 # Here we create the main VideoDisplay object using the selected driver.
-display = rv.displays.VideoDisplay(driver)
+display = rv.displays.VideoDisplay(
+    driver,
+
+    # Optionally skip updating the display when the same image is shown again.
+    # This is useful for slow displays (eg. SPI) with mostly static images.
+    # skip_unchanged = True,
+)
@@ -14,16 +14,10 @@
 # Import the Pin class for the board's default pins.
 from machine import Pin
 
-# Import the SPI bus.
-from .bus_spi import spi_sd as spi
-
-# When the SD card is initialized, it changes the SPI bus baudrate. We'll
-# want to revert it, so we need to know the original baudrate. There's no
-# way to get it directly, so we convert the bus to a string and parse it.
-# Example format:
-# "SPI(0, baudrate=24000000, sck=Pin(2), mosi=Pin(3), miso=Pin(4))"
-spi_str = str(spi)
-baudrate = int(spi_str[spi_str.index("baudrate=") + 9:].partition(",")[0])
+# Import the SPI bus, and the baudrate it was initialized with. When the SD
+# card is initialized, it changes the SPI bus baudrate, so we'll want to revert
+# it afterwards.
+from .bus_spi import spi_sd as spi, SPI_SD_BAUDRATE as baudrate
 
 # Set the chip select pin for the SD card.
 sd_cs = Pin(Pin.board.SD_CS, Pin.OUT)
@@ -19,4 +19,11 @@ import red_vision as rv
 from .bus_i2c import i2c
 
 # I2C interface
-touch_screen = rv.touch_screens.CST816(i2c)
+touch_screen = rv.touch_screens.CST816(
+    i2c,
+
+    # Optionally specify the touch screen's interrupt pin, if it's connected.
+    # Touch points are then queued when the interrupt triggers, so quick touch
+    # movements aren't missed by `read_touch_points()`.
+    # pin_irq = None,
+)
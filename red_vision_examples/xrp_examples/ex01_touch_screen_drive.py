@@ -21,6 +21,9 @@ from rv_init import display, touch_screen
 # Import NumPy
 from ulab import numpy as np
 
+# Import the key press utility to check for key presses without waiting
+from red_vision.utils.keys import poll_key
+
 # Dimensions and properties for the UI elements
 ui_shape = (240, 320, 3)
 ui_cx = ui_shape[1] // 2
@@ -29,7 +32,6 @@ button_size = 50
 button_cx = button_size // 2
 button_cy = button_size // 2
 button_spacing = 75
-button_shape = (button_size, button_size, 3)
 button_color = (255, 255, 255)
 arrow_length = 30
 arrow_thickness = 5
@@ -39,67 +41,100 @@ stop_size = 25
 stop_background_color = (0, 0, 255)
 
 def create_ui_image():
-    # Initialize arrow button image
-    img_arrow = np.zeros(button_shape, dtype=np.uint8)
-    img_arrow[:, :] = arrow_background_color
-    img_arrow = cv.arrowedLine(
-        img_arrow,
-        (button_cx, button_cy + arrow_length // 2),
-        (button_cx, button_cy - arrow_length // 2),
-        button_color,
-        arrow_thickness,
-        cv.FILLED,
-        0,
-        arrow_tip_length
-    )
-
-    # Initialize stop button image
-    img_button_stop = np.zeros(button_shape, dtype=np.uint8)
-    img_button_stop[:, :] = stop_background_color
-    img_button_stop = cv.rectangle(
-        img_button_stop,
-        (button_cx - stop_size // 2, button_cy - stop_size // 2),
-        (button_cx + stop_size // 2, button_cy + stop_size // 2),
-        button_color,
-        cv.FILLED
-    )
-
-    # Initialize UI image
+    # Initialize UI image. Everything is drawn directly onto this image, so no
+    # other images need to be allocated
     img_ui = np.zeros(ui_shape, dtype=np.uint8)
-    
+
     # Draw the stop button in the center
     img_ui[
         ui_cy-button_cy:ui_cy+button_cy,
         ui_cx-button_cx:ui_cx+button_cx
-    ] = img_button_stop
-    
-    # Draw the forward arrow above the stop button
-    img_ui[
-        ui_cy-button_spacing-button_cy:ui_cy-button_spacing+button_cy,
-        ui_cx-button_cx:ui_cx+button_cx
-    ] = img_arrow
-    
-    # Draw the backward arrow below the stop button
-    img_ui[
-        ui_cy+button_spacing-button_cy:ui_cy+button_spacing+button_cy,
-        ui_cx-button_cx:ui_cx+button_cx
-    ] = img_arrow[::-1, :]  # Flip the arrow image vertically
+    ] = stop_background_color
+    cv.rectangle(
+        img_ui,
+        (ui_cx - stop_size // 2, ui_cy - stop_size // 2),
+        (ui_cx + stop_size // 2, ui_cy + stop_size // 2),
+        button_color,
+        cv.FILLED
+    )
 
-    # Draw the left arrow to the left of the stop button
-    img_ui[
-        ui_cy-button_cy:ui_cy+button_cy,
-        ui_cx-button_spacing-button_cx:ui_cx-button_spacing+button_cx
-    ] = img_arrow.transpose((1, 0, 2))
-    
-    # Draw the right arrow to the right of the stop button
-    img_ui[
-        ui_cy-button_cy:ui_cy+button_cy,
-        ui_cx+button_spacing-button_cx:ui_cx+button_spacing+button_cx
-    ] = img_arrow.transpose((1, 0, 2))[:, ::-1]  # Flip the arrow image horizontally
+    # Draw the forward, backward, left, and right arrows around the stop
+    # button. Each arrow is given by the direction it points (dx, dy), and is
+    # drawn that direction away from the stop button
+    for dx, dy in ((0, -1), (0, 1), (-1, 0), (1, 0)):
+        x = ui_cx + dx * button_spacing
+        y = ui_cy + dy * button_spacing
+        img_ui[
+            y-button_cy:y+button_cy,
+            x-button_cx:x+button_cx
+        ] = arrow_background_color
+        cv.arrowedLine(
+            img_ui,
+            (x - dx * arrow_length // 2, y - dy * arrow_length // 2),
+            (x + dx * arrow_length // 2, y + dy * arrow_length // 2),
+            button_color,
+            arrow_thickness,
+            cv.FILLED,
+            0,
+            arrow_tip_length
+        )
 
     # Return the UI image
     return img_ui
 
+# Functions for each button's action. Each one returns True if the example
+# should exit
+def stop():
+    print("Stop")
+    return True
+
+def forward():
+    print("Forward")
+    drivetrain.straight(20, 0.5)
+
+def backward():
+    print("Backward")
+    drivetrain.straight(-20, 0.5)
+
+def right():
+    print("Right")
+    drivetrain.turn(-90, 0.5)
+
+def left():
+    print("Left")
+    drivetrain.turn(90, 0.5)
+
+# The buttons are laid out on a 3x3 grid centered on the UI, with each cell
+# `button_spacing` pixels wide and tall and a button in the center of the cell.
+# This lookup table gives the action for each cell of the grid, or None if there
+# is no button in that cell
+actions = (
+    None, forward, None,
+    left, stop, right,
+    None, backward, None,
+)
+grid_left = ui_cx - button_spacing - button_spacing // 2
+grid_top = ui_cy - button_spacing - button_spacing // 2
+
+# Finds the action for a touch point by looking up which grid cell it's in,
+# instead of checking the bounds of every button one at a time
+def get_action(x, y):
+    # Find the grid cell of the touch point, and its position within the cell
+    col, cell_x = divmod(x - grid_left, button_spacing)
+    row, cell_y = divmod(y - grid_top, button_spacing)
+
+    # Ignore touches outside the grid
+    if not (0 <= col < 3 and 0 <= row < 3):
+        return None
+
+    # Ignore touches in the cell but outside the button in its center
+    if (abs(cell_x - button_spacing // 2) > button_cx or
+            abs(cell_y - button_spacing // 2) > button_cy):
+        return None
+
+    # Look up the action for the cell
+    return actions[row * 3 + col]
+
 # Create the UI image and show it on the display
 cv.imshow(display, create_ui_image())
 
@@ -113,38 +148,15 @@ while True:
         # Read touch coordinates
         x, y = touch_screen.get_touch_xy()
         
-        # Check if the stop button was pressed
-        if (ui_cx - button_cx <= x <= ui_cx + button_cx and
-            ui_cy - button_cy <= y <= ui_cy + button_cy):
-            print("Stop")
+        # Find and run the action of the button that was pressed, if any. If
+        # the action returns True (the stop button), exit the loop
+        action = get_action(x, y)
+        if action is not None and action():
             break
-        
-        # Check if the forward arrow was pressed
-        elif (ui_cx - button_cx <= x <= ui_cx + button_cx and
-              ui_cy - button_spacing - button_cy <= y <= ui_cy - button_spacing + button_cy):
-            print("Forward")
-            drivetrain.straight(20, 0.5)
-        
-        # Check if the backward arrow was pressed
-        elif (ui_cx - button_cx <= x <= ui_cx + button_cx and
-              ui_cy + button_spacing - button_cy <= y <= ui_cy + button_spacing + button_cy):
-            print("Backward")
-            drivetrain.straight(-20, 0.5)
-        
-        # Check if the right arrow was pressed
-        elif (ui_cy - button_cy <= y <= ui_cy + button_cy and
-              ui_cx + button_spacing - button_cx <= x <= ui_cx + button_spacing + button_cx):
-            print("Right")
-            drivetrain.turn(-90, 0.5)
-        
-        # Check if the left arrow was pressed
-        elif (ui_cy - button_cy <= y <= ui_cy + button_cy and
-              ui_cx - button_spacing - button_cx <= x <= ui_cx - button_spacing + button_cx):
-            print("Left")
-            drivetrain.turn(90, 0.5)
-
-    # Check for key presses
-    key = cv.waitKey(1)
+
+    # Check for key presses. `poll_key()` returns immediately if no key was
+    # pressed, unlike `cv.waitKey(1)` which always waits at least 1 ms
+    key = poll_key()
 
     # If any key is pressed, exit the loop
     if key != -1:
@@ -30,19 +30,59 @@ from XRPLib.defaults import drivetrain, servo_one, board
 import cv2 as cv
 from rv_init import display, camera
 
+# Import NumPy
+from ulab import numpy as np
+
+# Import the key press utility to check for key presses without waiting
+from red_vision.utils.keys import poll_key
+
 # Import time for delays
 import time
 
-# Import math for calculations
-import math
-
-# This is the pipeline implementation that attempts to find an orange ring in
-# an image, and returns the real-world distance to the ring and its left/right
-# position relative to the center of the image in centimeters
-def find_orange_ring_pipeline(frame):
-    # Convert the frame to HSV color space, which is often more effective for
+# Import math functions for calculations
+from math import atan2, degrees
+
+# Kernels for the morphological operations in the pipeline, see below. These
+# never change, so they're created once here instead of every frame
+kernel_3x3 = cv.getStructuringElement(cv.MORPH_RECT, (3, 3))
+kernel_5x5 = cv.getStructuringElement(cv.MORPH_RECT, (5, 5))
+
+# Whether to draw the detection results on the frame for visualization. This is
+# helpful while tuning the pipeline, but drawing takes extra time, so you can
+# set this to False once the pipeline works well
+draw_results = True
+
+# Every frame, the pipeline needs an HSV image and a binary mask image. Creating
+# new images every frame takes time and causes frequent garbage collection, so
+# they're created once and reused. The pipeline searches images of a couple
+# different sizes (see below), so the images are stored by size and created the
+# first time each size is needed
+_pipeline_buffers = {}
+
+def get_pipeline_buffers(height, width):
+    buffers = _pipeline_buffers.get((height, width))
+    if buffers is None:
+        hsv = np.zeros((height, width, 3), dtype=np.uint8)
+        mask = np.zeros((height, width), dtype=np.uint8)
+        buffers = (hsv, mask)
+        _pipeline_buffers[(height, width)] = buffers
+    return buffers
+
+# This finds the contour of an orange ring in an image, and returns it. If no
+# ring was found, None is returned
+def find_ring_contour(image):
+    # First we shrink the image to half the width and height. The ring is still
+    # dozens of pixels across at this size, so it's easily detectable, and every
+    # following step has only a quarter as many pixels to process, which makes
+    # the whole pipeline much faster. `cv.INTER_AREA` averages each 2x2 block of
+    # pixels, which also reduces noise. The result is written into the reused
+    # HSV image, since it gets converted in place next
+    hsv, in_range = get_pipeline_buffers(image.shape[0] // 2, image.shape[1] // 2)
+    small = cv.resize(image, (hsv.shape[1], hsv.shape[0]), hsv, interpolation=cv.INTER_AREA)
+
+    # Convert the image to HSV color space, which is often more effective for
     # color-based segmentation tasks than RGB or BGR color spaces
-    hsv = cv.cvtColor(frame, cv.COLOR_BGR2HSV)
+    hsv = cv.cvtColor(small, cv.COLOR_BGR2HSV, hsv)
 
     # Here we use the `cv.inRange()` function to find all the orange pixels.
     # This outputs a binary image where pixels that fall within the specified
@@ -55,20 +95,27 @@ def find_orange_ring_pipeline(frame):
     # Value: Anything above 30 is bright enough
     lower_bound = (15, 50, 30)
     upper_bound = (25, 255, 255)
-    in_range = cv.inRange(hsv, lower_bound, upper_bound)
+    in_range = cv.inRange(hsv, lower_bound, upper_bound, in_range)
 
     # Noise in the image often causes `cv.inRange()` to return false positives
     # and false negatives, meaning there are some incorrect pixels in the binary
     # image. These can be cleaned up with morphological operations, which
     # effectively grow and shrink regions in the binary image to remove tiny
     # blobs of noise
-    kernel = cv.getStructuringElement(cv.MORPH_RECT, (3, 3))
-    morph_open = cv.morphologyEx(in_range, cv.MORPH_OPEN, kernel)
-    morph_close = cv.morphologyEx(morph_open, cv.MORPH_CLOSE, kernel)
+    # 
+    # A morphological "open" (erode then dilate) removes small white specks,
+    # and a "close" (dilate then erode) fills small black holes. Doing both with
+    # a 3x3 kernel would erode, dilate twice, then erode. Dilating twice with a
+    # 3x3 kernel is the same as dilating once with a 5x5 kernel, so we can skip
+    # one pass over the image. Each step writes back into the same image to
+    # avoid allocating new ones
+    cv.erode(in_range, kernel_3x3, in_range)
+    cv.dilate(in_range, kernel_5x5, in_range)
+    cv.erode(in_range, kernel_3x3, in_range)
 
     # Now we use `cv.findContours()` to find the contours in the binary image,
     # which are the boundaries of the regions in the binary image
-    contours, hierarchy = cv.findContours(morph_close, cv.RETR_EXTERNAL, cv.CHAIN_APPROX_SIMPLE)
+    contours, hierarchy = cv.findContours(in_range, cv.RETR_EXTERNAL, cv.CHAIN_APPROX_SIMPLE)
 
     # It's possible that no contours were found, so first check if any were
     # found before proceeding
@@ -80,22 +127,61 @@ def find_orange_ring_pipeline(frame):
         # based on size, shape, or other criteria. This example keeps it simple;
         # the contour of a ring is a circle, meaning many points are needed to
         # represent it. A contour with only a few points is obviously not a
-        # circle, so we can ignore it. This example assumes the ring is the only
-        # large orange object in the image, so the first contour that's complex
-        # enough is probably the one we're looking for
-        for i in range(len(contours)):
-            if len(contours[i]) < 50:
-                continue
-            best_contour = contours[i]
-            break
-    
-    # If no contour was found, return invalid values to indicate that
-    if best_contour is None:
-        return -1, -1
+        # circle, so we can ignore it. This example assumes the ring is the
+        # largest orange object in the image, so the contour with the most
+        # points is probably the one we're looking for, as long as it's complex
+        # enough. The built-in `max()` function finds it faster than checking
+        # each contour in a regular loop. The image was shrunk, so the ring's
+        # contour has about half as many points as it would at full size
+        candidates = [c for c in contours if len(c) >= 25]
+        if candidates:
+            # The contour was found in the half size image, so scale it back to
+            # the size of the original image
+            best_contour = max(candidates, key=len) * 2
+    return best_contour
 
-    # Calculate the bounding rectangle of the contour, and use that to calculate
-    # the center coordinates of the ring
-    left, top, width, height = cv.boundingRect(best_contour)
+# This is the pipeline implementation that attempts to find an orange ring in
+# an image, and returns the real-world distance to the ring and its left/right
+# position relative to the center of the image in centimeters. If `draw` is
+# True, the results are also drawn on the frame
+def find_orange_ring_pipeline(frame, draw=False):
+    # The ring is usually near the center of the frame, so we first search only
+    # a region of interest (ROI) covering the middle 2/3 of the frame. Slicing
+    # the frame doesn't copy any data, and every step of `find_ring_contour()`
+    # has less than half as many pixels to process
+    frame_height, frame_width = frame.shape[0], frame.shape[1]
+    roi_x = frame_width // 6
+    roi_y = frame_height // 6
+    roi = frame[roi_y:frame_height-roi_y, roi_x:frame_width-roi_x]
+    best_contour = find_ring_contour(roi)
+
+    # Calculate the bounding rectangle of the contour. If the ring touches the
+    # edge of the ROI, part of it may have been cut off, which would make the
+    # size wrong, so it's treated as not found. The contour was scaled up from
+    # the half size image, so it can end 1 pixel short of the ROI's far edges
+    if best_contour is not None:
+        left, top, width, height = cv.boundingRect(best_contour)
+        if (left <= 0 or top <= 0 or
+                left + width >= roi.shape[1] - 1 or
+                top + height >= roi.shape[0] - 1):
+            best_contour = None
+
+    # If the ring wasn't found in the ROI, fall back to searching the full frame
+    if best_contour is None:
+        roi_x = 0
+        roi_y = 0
+        best_contour = find_ring_contour(frame)
+
+        # If no contour was found, return invalid values to indicate that
+        if best_contour is None:
+            return -1, -1
+        left, top, width, height = cv.boundingRect(best_contour)
+
+    # The contour's coordinates are relative to the ROI, so offset the bounding
+    # rectangle to get the position in the frame, and use that to calculate the
+    # center coordinates of the ring
+    left += roi_x
+    top += roi_y
     center_x = left + width // 2
     center_y = top + height // 2
 
@@ -130,14 +216,16 @@ def find_orange_ring_pipeline(frame):
     position_x_px = center_x - (frame.shape[1] // 2)
     position_x_cm = distance_cm * position_x_px / focal_length_px
 
-    # Draw the contour, bounding box, center, and text for visualization
-    frame = cv.drawContours(frame, [best_contour], -1, (0, 0, 255), 2)
-    frame = cv.rectangle(frame, (left, top), (left + width, top + height), (255, 0, 0), 2)
-    frame = cv.drawMarker(frame, (center_x, center_y), (0, 255, 0), cv.MARKER_CROSS, 10, 2)
-    frame = cv.putText(frame, f"({center_x}, {center_y})", (center_x - 45, center_y - 10), cv.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-    frame = cv.putText(frame, f"{width}x{height}", (left, top - 10), cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
-    frame = cv.putText(frame, f"D={distance_cm:.1f}cm", (left, top - 25), cv.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 2)
-    frame = cv.putText(frame, f"X={position_x_cm:.1f}cm", (left, top - 40), cv.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 2)
+    # Draw the contour, bounding box, center, and text for visualization, if
+    # requested
+    if draw:
+        frame = cv.drawContours(frame, [best_contour], -1, (0, 0, 255), 2, offset=(roi_x, roi_y))
+        frame = cv.rectangle(frame, (left, top), (left + width, top + height), (255, 0, 0), 2)
+        frame = cv.drawMarker(frame, (center_x, center_y), (0, 255, 0), cv.MARKER_CROSS, 10, 2)
+        frame = cv.putText(frame, f"({center_x}, {center_y})", (center_x - 45, center_y - 10), cv.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+        frame = cv.putText(frame, f"{width}x{height}", (left, top - 10), cv.FONT_HERSHEY_SIMPLEX, 0.5, (255, 0, 0), 2)
+        frame = cv.putText(frame, f"D={distance_cm:.1f}cm", (left, top - 25), cv.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 2)
+        frame = cv.putText(frame, f"X={position_x_cm:.1f}cm", (left, top - 40), cv.FONT_HERSHEY_SIMPLEX, 0.5, (0, 0, 0), 2)
 
     # Now we can return the distance and position of the ring in cm, since
     # that's the only data we need from this pipeline
@@ -158,16 +246,21 @@ time.sleep(0.1)
 # Prompt the user to press a key to continue
 print("Detecting ring...")
 
+# The frame array is allocated by the first `camera.read()`, then passed back
+# in so every following frame is read into the same array. This avoids
+# allocating a new frame every loop
+frame = None
+
 # Loop until the ring is found or the user presses a key
 while True:
     # Read a frame from the camera
-    success, frame = camera.read()
+    success, frame = camera.read(frame)
     if not success:
         print("Error reading frame from camera")
         break
 
     # Call the pipeline function to find the ring
-    distance_cm, position_x_cm = find_orange_ring_pipeline(frame)
+    distance_cm, position_x_cm = find_orange_ring_pipeline(frame, draw_results)
 
     # Display the frame
     cv.imshow(display, frame)
@@ -176,8 +269,9 @@ while True:
     if distance_cm >= 0:
         break
 
-    # Check for key presses
-    key = cv.waitKey(1)
+    # Check for key presses. `poll_key()` returns immediately if no key was
+    # pressed, unlike `cv.waitKey(1)` which always waits at least 1 ms
+    key = poll_key()
 
     # If any key is pressed, exit the loop
     if key != -1:
@@ -199,7 +293,7 @@ servo_one.set_angle(45)
 
 # Turn to face the ring. We first calculate the angle to turn based on the
 # position of the ring
-angle = -math.atan2(position_x_cm, distance_cm) * 180 / math.pi
+angle = -degrees(atan2(position_x_cm, distance_cm))
 drivetrain.turn(angle)
 
 # Drive forwards to put the arm through the ring